@@ -4,7 +4,8 @@ import re
 import requests
 import hashlib
 from pathlib import Path
-from config import get_ai_model
+from config import OLLAMA_GENERATE_URL, get_ai_model
+from fileIndex import find_files
 
 
 # LOAD / SAVE MEMORY
@@ -64,7 +65,7 @@ class Interpreter:
     def __init__(self, ROOT, allowed_paths=None, ai_model=None):
         self.ROOT = ROOT
         self.memory = load_memory()
-        self.ai_url = "http://localhost:11434/api/generate"
+        self.ai_url = OLLAMA_GENERATE_URL
         self.ai_model = ai_model or get_ai_model()
         self.allowed_paths = allowed_paths or []
         # Cache static prompt (built once per session)
@@ -119,10 +120,26 @@ class Interpreter:
             # No keywords, return all files (but limit to 150)
             return root_files[:150]
         
+        # Files whose indexed keywords match exactly come straight from the
+        # file index; only the files it didn't return get the substring checks
+        file_index = self.memory.get("file_index", {})
         candidates = []
-        file_notes = self.memory.get("file_notes", {})
+        indexed_hits = set()
+        for kw in keywords:
+            for f in find_files(file_index, kw):
+                # The index covers every file; keep root-level ones only
+                if id(f) not in indexed_hits and "/" not in f.get('path', ''):
+                    indexed_hits.add(id(f))
+                    candidates.append(f)
         
+        file_notes = self.memory.get("file_notes", {})
         for f in root_files:
+            # No need to keep scanning once the cap is reached
+            if len(candidates) >= 150:
+                break
+            if id(f) in indexed_hits:
+                continue
+            
             name_lower = f.get('name', '').lower()
             path_lower = f.get('path', '').lower()
             
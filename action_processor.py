@@ -6,6 +6,7 @@ This module contains the core logic for executing file operations and handling
 action inference when the AI claims to do something but doesn't generate proper actions.
 """
 
+import logging
 import re
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -15,6 +16,8 @@ from PyQt6.QtWidgets import QDialog
 from tools import list_files, move_file, file_type, create_folder, read_file, list_all_files
 from dialogs import PreviewDialog
 
+logger = logging.getLogger(__name__)
+
 
 def process_single_action(
     gui_instance,
@@ -44,7 +47,7 @@ def process_single_action(
     msg_lower = msg.lower()
     user_msg = gui_instance.conversation_history[-1].get("content", "").lower() if gui_instance.conversation_history else ""
     
-    print(f"[DEBUG] _process_single_action: action={action}, msg={msg[:50]}, user_msg={user_msg[:50]}")
+    logger.debug("_process_single_action: action=%s, msg=%.50s, user_msg=%.50s", action, msg, user_msg)
     
     # Check if this is a question - if so, don't infer actions, let the AI ask
     is_question = msg.endswith("?") or any(word in msg_lower for word in ["would you", "should i", "do you", "which", "what", "how", "can you", "could you", "would you like"])
@@ -70,7 +73,7 @@ def process_single_action(
                     "message": ai.get("message", "").strip() or f"Creating folder: {folder_name}"
                 }
                 action = ai.get("action")
-                gui_instance.log_box.append(f"<span style='color:{gui_instance.highlight_blue}; font-weight:bold; font-size:11px;'>Inferred create_folder action for: {folder_name}</span>")
+                gui_instance.log_append(f"Inferred create_folder action for: {folder_name}")
     
     # If AI said it will repeat but didn't - force it to repeat the last action
     elif action in ["none", "chat"] and not is_question and gui_instance.last_action and any(phrase in msg_lower for phrase in repeat_phrases):
@@ -164,14 +167,14 @@ def process_single_action(
         if result.get("error"):
             error_msg = result.get("error", "Unknown error")
             gui_instance.chat_box.append(f"<span style='color:{gui_instance.error_red}; font-weight:bold; font-size:12px;'>{gui_instance.ai_name}:</span> <span style='color:{gui_instance.error_red}; font-weight:bold;'>I can't do that. {error_msg}</span>")
-            gui_instance.log_box.append(f"<span style='color:{gui_instance.error_red}; font-weight:bold; font-size:11px;'>Error: {error_msg}</span>")
+            gui_instance.log_append(f"Error: {error_msg}", "err")
         else:
             gui_instance.chat_box.append(f"<span style='color:{gui_instance.success_green}; font-weight:bold; font-size:12px;'>COMPLETE:</span> <span style='color:{gui_instance.success_green}; font-weight:bold;'>{clean_msg}</span>")
 
 
 def _infer_and_execute_move_actions(gui_instance, user_msg: str, msg_lower: str) -> None:
     """Infer move_file actions when AI claims to sort but doesn't generate actions."""
-    gui_instance.log_box.append(f"<span style='color:#ff6600; font-weight:bold; font-size:11px;'>AI claimed to sort files but returned action 'none' or 'chat'. Attempting to infer move actions...</span>")
+    gui_instance.log_append("AI claimed to sort files but returned action 'none' or 'chat'. Attempting to infer move actions...", "warn")
     
     file_index = gui_instance.memory.data.get("file_index", {}).get("all_files", [])
     categories = gui_instance.memory.data.get("categories", {})
@@ -232,7 +235,7 @@ def _infer_and_execute_move_actions(gui_instance, user_msg: str, msg_lower: str)
                     break
     
     if inferred_actions:
-        gui_instance.log_box.append(f"<span style='color:{gui_instance.highlight_blue}; font-weight:bold; font-size:11px;'>Inferred {len(inferred_actions)} move_file action(s)</span>")
+        gui_instance.log_append(f"Inferred {len(inferred_actions)} move_file action(s)")
         for i, action_item in enumerate(inferred_actions):
             process_single_action(gui_instance, action_item, is_multi_action=True, action_num=i+1, total_actions=len(inferred_actions))
     else:
@@ -462,7 +465,7 @@ def _handle_create_folder(gui_instance, args: dict) -> Optional[Dict[str, Any]]:
                                 gui_instance.memory.data.setdefault("categories", {})[category_name] = str(created_path_obj)
                                 gui_instance.memory.save()
                                 gui_instance._refresh_categories_list()
-                                gui_instance.log_box.append(f"<span style='color:{gui_instance.highlight_blue}; font-weight:bold; font-size:11px;'>Added '{category_name}' to categories</span>")
+                                gui_instance.log_append(f"Added '{category_name}' to categories")
                     except (ValueError, AttributeError):
                         pass
                 
@@ -471,11 +474,11 @@ def _handle_create_folder(gui_instance, args: dict) -> Optional[Dict[str, Any]]:
         else:
             error_msg = result.get("error", "Unknown error") if result else "Failed to create folder"
             gui_instance.chat_box.append(f"<span style='color:{gui_instance.error_red}; font-weight:bold; font-size:12px;'>{gui_instance.ai_name}:</span> <span style='color:{gui_instance.error_red}; font-weight:bold;'>I can't create that folder. {error_msg}</span>")
-            gui_instance.log_box.append(f"<span style='color:{gui_instance.error_red}; font-weight:bold; font-size:11px;'>Error: {error_msg}</span>")
+            gui_instance.log_append(f"Error: {error_msg}", "err")
             return None
     except Exception as e:
         gui_instance.chat_box.append(f"<span style='color:{gui_instance.error_red}; font-weight:bold; font-size:12px;'>{gui_instance.ai_name}:</span> <span style='color:{gui_instance.error_red}; font-weight:bold;'>I can't create that folder. {str(e)}</span>")
-        gui_instance.log_box.append(f"<span style='color:{gui_instance.error_red}; font-weight:bold; font-size:11px;'>Error creating folder: {str(e)}</span>")
+        gui_instance.log_append(f"Error creating folder: {str(e)}", "err")
         return None
     
     return result
@@ -4,10 +4,12 @@ AI REPLY HANDLER MODULE
 Functions for processing AI replies and handling validation errors.
 """
 
-import re
+import logging
 
 from validation import validate_ai_payload
 
+logger = logging.getLogger(__name__)
+
 
 def process_ai_reply(gui_instance, ai):
     """Process an AI reply and execute actions.
@@ -17,7 +19,7 @@ def process_ai_reply(gui_instance, ai):
         ai: The AI response dict
     """
     # Debug: log what we received
-    print(f"[DEBUG] process_ai_reply received: {ai}")
+    logger.debug("process_ai_reply received: %s", ai)
     
     # Clean up worker after processing
     if gui_instance.current_worker:
@@ -35,24 +37,17 @@ def process_ai_reply(gui_instance, ai):
     # Re-enable input
     gui_instance.set_processing_state(False)
     
-    # Replace "Thinking..." with actual response (simple text replacement)
-    html = gui_instance.chat_box.toHtml()
-    if "Thinking..." in html or "id='thinking'" in html:
-        # Find and replace the thinking message (more flexible pattern matching)
-        html = re.sub(r"<span[^>]*id=['\"]thinking['\"][^>]*>.*?</span>", '', html, flags=re.DOTALL)
-        # Remove empty AI line if it exists
-        html = html.replace(f'<span style="color:#888; font-style:italic;">{gui_instance.ai_name}:</span> <br>', '')
-        html = html.replace(f'<span style="color:#0080ff; font-style:italic; font-weight:bold; font-size:11px; background:#e6f2ff; padding:2px 6px; border:1px solid #0080ff;">{gui_instance.ai_name}:</span> <br>', '')
-        gui_instance.chat_box.setHtml(html)
+    # Remove the "Thinking..." line; the reply is appended below
+    gui_instance.chat_box.replace_thinking()
     
     # Ensure we always have a dict
     if not isinstance(ai, dict):
         # Log warning to file operations log instead of chat
-        gui_instance.log_box.append(f"<span style='color:#8b4513; font-weight:bold; font-size:11px;'>Warning: Invalid response format from AI worker</span>")
+        gui_instance.log_append("Warning: Invalid response format from AI worker", "warn")
         return
     
     ok, ai_norm, err = validate_ai_payload(ai)
-    print(f"[DEBUG] validate_ai_payload: ok={ok}, err={err}, normalized={ai_norm}")
+    logger.debug("validate_ai_payload: ok=%s, err=%s, normalized=%s", ok, err, ai_norm)
     if not ok:
         # Show any conversational message we did get, but don't show technical errors in chat
         msg = str(ai.get("message", "") or "").strip()
@@ -64,7 +59,7 @@ def process_ai_reply(gui_instance, ai):
         return
     
     ai = ai_norm
-    print(f"[DEBUG] After validation, processing: action={ai.get('action')}, args={ai.get('args')}, has_actions={('actions' in ai)}")
+    logger.debug("After validation, processing: action=%s, args=%s, has_actions=%s", ai.get("action"), ai.get("args"), "actions" in ai)
     
     # Handle multiple actions
     if "actions" in ai and isinstance(ai["actions"], list):
@@ -122,5 +117,5 @@ def _handle_validation_error(gui_instance, err, ai):
         gui_instance.chat_box.append(f"<span style='color:{gui_instance.highlight_blue}; font-weight:bold; font-size:12px;'>{gui_instance.ai_name}:</span> <span style='color:{gui_instance.text}; font-weight:bold;'>{helpful_msg}</span>")
     else:
         # Log technical error to operations log
-        gui_instance.log_box.append(f"<span style='color:{gui_instance.error_red}; font-weight:bold; font-size:11px;'>Error: {err}</span>")
+        gui_instance.log_append(f"Error: {err}", "err")
 
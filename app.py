@@ -5,13 +5,14 @@ Main GUI application for AI-powered file sorting and organization.
 Uses Ollama for local AI processing and PyQt6 for the Windows 95-style interface.
 """
 
+import logging
 import sys
 import time
 from pathlib import Path
 
 from Interpreter import Interpreter
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QMessageBox, QMenu, QDialog, QFileDialog
@@ -37,12 +38,15 @@ from ui_components import CustomTitleBar
 from category_utils import add_category, auto_add_directory_categories, refresh_categories_list, remove_category
 from note_utils import refresh_notes_list, edit_note_dialog, remove_file_note, generate_notes_for_files
 from action_processor import process_single_action
-from ui_builder import build_main_ui, build_preferences_panel
+from ui_builder import build_main_ui, build_preferences_panel, ensure_detail_page
 from operation_utils import add_action_card, show_operation_details, update_operation_stats
 from file_indexing import scan_all_files_for_ai, start_indexing, auto_scan_for_missing_args
+from filenameParser import clear_filename_cache
+from fileIndex import set_all_files
 from ai_reply_handler import process_ai_reply
 
-
+# Counter updates within this window are folded into one label refresh
+COUNTERS_REFRESH_MS = 100
 
 
 class FileAdvisorGUI(QMainWindow):
@@ -63,6 +67,8 @@ class FileAdvisorGUI(QMainWindow):
         # Indexing worker (will be started after window is shown)
         self.indexing_worker = None
         self.indexing_progress = None
+        self.indexing_progress_timer = None  # Polls worker progress while indexing
+        self.note_worker = None  # Background "Generate Notes" run
         
         # Conversation history for context (last 10 messages)
         self.conversation_history = []
@@ -74,11 +80,14 @@ class FileAdvisorGUI(QMainWindow):
         self.files_scanned = 0
         self.files_moved = 0
         self.start_time = time.time()
+        self._counters_refresh_pending = False  # Label refresh queued by update_counters
 
         # Track individual operations for detailed stats
         self.operations = []  # List of operation dicts with id, action, path, stats, etc.
+        self.operations_by_id = {}  # Same operation dicts keyed by id for lookups
         self.operation_counter = 0
         self.selected_operation_id = None
+        self._details_refresh_pending = False  # Detail view refresh queued by update_operation_stats
 
         # Windows 95 retro theme colors - more vibrant!
         self.bg = "#a8a8a8"  # Darker Windows grey
@@ -108,6 +117,14 @@ class FileAdvisorGUI(QMainWindow):
         """Add an action card to the operations log."""
         return add_action_card(self, icon, title, subtitle, bg, action_type)
     
+    def log_append(self, text, kind="info"):
+        """Add a status line to the operations log.
+
+        kind picks a prebuilt format: "info", "warn" or "err". The text is
+        inserted as plain text, no HTML parsing.
+        """
+        self.log_box.append_fragments([(text, self._log_fmts[kind])])
+    
     def on_operation_clicked(self, url):
         """Handle click on operation card"""
         url_str = url.toString()
@@ -120,6 +137,7 @@ class FileAdvisorGUI(QMainWindow):
     
     def show_operation_details(self, operation_id):
         """Show detailed stats for a specific operation"""
+        ensure_detail_page(self)
         show_operation_details(self, operation_id)
     
     def update_operation_stats(self, operation_id, files_scanned=0, files_moved=0):
@@ -152,6 +170,10 @@ class FileAdvisorGUI(QMainWindow):
         old_root = self.memory.data.get("file_index", {}).get("root_path")
         new_root = str(self.perms.allowed_root) if self.perms.allowed_root else None
         
+        # Parsed filenames from the old root are no longer useful
+        if old_root != new_root:
+            clear_filename_cache()
+        
         # Update categories based on new root directory
         self._auto_add_directory_categories()
         # Scan all files for AI context (this will clear old files if root changed)
@@ -159,17 +181,17 @@ class FileAdvisorGUI(QMainWindow):
     
     def _refresh_categories_list(self):
         """Refresh the categories list widget"""
-        refresh_categories_list(self.categories_list, self.memory)
+        refresh_categories_list(self.categories_list.model(), self.memory)
     
     def _show_category_context_menu(self, position):
         """Show context menu for removing categories"""
-        item = self.categories_list.itemAt(position)
-        if item:
+        index = self.categories_list.indexAt(position)
+        if index.isValid():
             menu = QMenu(self)
             remove_action = menu.addAction("Remove Category")
             action = menu.exec(self.categories_list.mapToGlobal(position))
             if action == remove_action:
-                category = item.text()
+                category = index.data()
                 self._remove_category(category)
     
     def _remove_category(self, category):
@@ -249,25 +271,25 @@ class FileAdvisorGUI(QMainWindow):
     
     def _refresh_notes_list(self):
         """Refresh the file notes list widget"""
-        refresh_notes_list(self.notes_list, self.memory)
+        refresh_notes_list(self.notes_list.model(), self.memory)
     
     def _show_note_context_menu(self, position):
         """Show context menu for editing/removing notes"""
-        item = self.notes_list.itemAt(position)
-        if item:
+        index = self.notes_list.indexAt(position)
+        if index.isValid():
             menu = QMenu(self)
             edit_action = menu.addAction("Edit Note")
             remove_action = menu.addAction("Remove Note")
             action = menu.exec(self.notes_list.mapToGlobal(position))
             if action == edit_action:
-                self._edit_note(item)
+                self._edit_note(index)
             elif action == remove_action:
-                file_path = item.data(Qt.ItemDataRole.UserRole)
+                file_path = index.data(Qt.ItemDataRole.UserRole)
                 self._remove_file_note(file_path)
     
-    def _edit_note(self, item):
+    def _edit_note(self, index):
         """Edit an existing note with a proper dialog"""
-        file_path = item.data(Qt.ItemDataRole.UserRole)
+        file_path = index.data(Qt.ItemDataRole.UserRole)
         if not file_path:
             return
         
@@ -311,8 +333,8 @@ class FileAdvisorGUI(QMainWindow):
             "border_light": self.border_light,
             "button_bg": self.button_bg
         }
-        generate_notes_for_files(self.perms, self.memory, self, theme_colors)
-        self._refresh_notes_list()
+        # Runs in the background; the notes list refreshes when it finishes
+        generate_notes_for_files(self.perms, self.memory, self, theme_colors, on_finished=self._refresh_notes_list)
     
     def _auto_scan_for_missing_args(self, action_type="scan"):
         """Automatically scan files to help user when args are missing"""
@@ -320,6 +342,15 @@ class FileAdvisorGUI(QMainWindow):
 
     # COUNTER UPDATE
     def update_counters(self):
+        """Queue a refresh of the counter labels; calls within
+        COUNTERS_REFRESH_MS share a single refresh."""
+        if self._counters_refresh_pending:
+            return
+        self._counters_refresh_pending = True
+        QTimer.singleShot(COUNTERS_REFRESH_MS, self._refresh_counters)
+    
+    def _refresh_counters(self):
+        self._counters_refresh_pending = False
         elapsed = round(time.time() - self.start_time, 1)
         self.files_scanned_label.setText(f"Scanned: {self.files_scanned}")
         self.files_moved_label.setText(f"Moved: {self.files_moved}")
@@ -341,19 +372,22 @@ class FileAdvisorGUI(QMainWindow):
         # Clear the file index to force a full re-scan
         if "file_index" in self.memory.data:
             self.memory.data["file_index"]["last_scan"] = None
-            self.memory.data["file_index"]["all_files"] = []
+            set_all_files(self.memory.data["file_index"], [])
             self.memory.save()
         
         # Start indexing (will detect that index is invalid and do full scan)
         self._start_indexing()
     
-    def _on_indexing_progress(self, current, total, filename):
-        """Update progress dialog"""
-        if self.indexing_progress:
-            # current is already a percentage (0-100)
-            self.indexing_progress.setValue(current)
-            self.indexing_progress.setLabelText(f"{filename}")
-            QApplication.processEvents()
+    def _on_indexing_progress(self):
+        """Update progress dialog from the worker's latest progress (timer-driven)"""
+        if self.indexing_progress and self.indexing_worker:
+            # progress_pct is already a percentage (0-100)
+            current = self.indexing_worker.progress_pct
+            filename = self.indexing_worker.progress_text
+            if self.indexing_progress.value() != current:
+                self.indexing_progress.setValue(current)
+            if self.indexing_progress.labelText() != filename:
+                self.indexing_progress.setLabelText(filename)
     
     def _cancel_indexing(self):
         """Cancel indexing when user clicks cancel"""
@@ -362,6 +396,8 @@ class FileAdvisorGUI(QMainWindow):
     
     def _on_indexing_finished(self):
         """Handle indexing completion"""
+        if self.indexing_progress_timer:
+            self.indexing_progress_timer.stop()
         if self.indexing_progress:
             self.indexing_progress.setValue(100)
             self.indexing_progress.close()
@@ -380,7 +416,12 @@ class FileAdvisorGUI(QMainWindow):
         if self.indexing_worker and self.indexing_worker.isRunning():
             self.indexing_worker.cancel()
             self.indexing_worker.wait(3000)  # Wait up to 3 seconds
-        
+
+        # Cancel note generation if running
+        if self.note_worker and self.note_worker.isRunning():
+            self.note_worker.cancel()
+            self.note_worker.wait(3000)
+
         if hasattr(self, 'current_worker') and self.current_worker:
             if self.current_worker.isRunning():
                 # Disconnect signals first to prevent callbacks during cleanup
@@ -405,6 +446,10 @@ class FileAdvisorGUI(QMainWindow):
         dialog = PermissionsDialog(self.perms, self)
         dialog.exec()
 
+    def _thinking_html(self, status):
+        """AI status line shown while a request is in flight (or cancelled)."""
+        return f"<span style='color:{self.highlight_blue}; font-weight:bold; font-size:12px;'>{self.ai_name}:</span> <span style='color:#0080ff; font-style:italic; font-weight:bold; font-size:11px; background:#e6f2ff;'>{status}</span>"
+
     # SEND BUTTON
     def handle_send(self):
         # If processing, cancel the current request (send button becomes cancel button)
@@ -427,7 +472,7 @@ class FileAdvisorGUI(QMainWindow):
         # 2️ Show thinking indicator
         self.set_processing_state(True)
         # Append thinking message - we'll replace it when response comes
-        self.chat_box.append(f"<span style='color:{self.highlight_blue}; font-weight:bold; font-size:12px;'>{self.ai_name}:</span> <span style='color:#0080ff; font-style:italic; font-weight:bold; font-size:11px; background:#e6f2ff; padding:2px 6px; border:1px solid #0080ff;' id='thinking'>Thinking...</span>")
+        self.chat_box.append_thinking(self._thinking_html("Thinking..."))
 
         # 3️ Add to conversation history (before processing)
         self.conversation_history.append({"role": "user", "content": user_text})
@@ -448,61 +493,18 @@ class FileAdvisorGUI(QMainWindow):
         # The input box stays enabled - we just prevent submission via handle_send
         self.send_btn.setEnabled(True)  # Always enabled, but changes function
         
+        # ui_theme.qss styles QPushButton#sendBtn[processing="true"] as the red
+        # cancel button; a dynamic property change needs a re-polish to apply
+        self.send_btn.setProperty("processing", processing)
+        style = self.send_btn.style()
+        style.unpolish(self.send_btn)
+        style.polish(self.send_btn)
+        
         if processing:
             self.send_btn.setText("✕")
-            self.send_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #ff8080, stop:1 #ff0000);
-                    color: white;
-                    border-radius: 0px;
-                    font-size: 16px;
-                    font-weight: bold;
-                    border-top: 2px outset {self.border_light};
-                    border-left: 2px outset {self.border_light};
-                    border-bottom: 2px outset {self.border_dark};
-                    border-right: 2px outset {self.border_dark};
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #ffa0a0, stop:1 #ff4040);
-                }}
-                QPushButton:pressed {{
-                    background: #ff0000;
-                    border-top: 2px inset {self.border_dark};
-                    border-left: 2px inset {self.border_dark};
-                    border-bottom: 2px inset {self.border_light};
-                    border-right: 2px inset {self.border_light};
-                }}
-            """)
             self.send_btn.setToolTip("Cancel request")
         else:
             self.send_btn.setText("➤")
-            self.send_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #d4d0c8, stop:1 #c0c0c0);
-                    color: {self.text};
-                    border-radius: 0px;
-                    font-size: 20px;
-                    border-top: 2px outset {self.border_light};
-                    border-left: 2px outset {self.border_light};
-                    border-bottom: 2px outset {self.border_dark};
-                    border-right: 2px outset {self.border_dark};
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #e8e4dc, stop:1 #d4d0c8);
-                }}
-                QPushButton:pressed {{
-                    background: {self.button_bg};
-                    border-top: 2px inset {self.border_dark};
-                    border-left: 2px inset {self.border_dark};
-                    border-bottom: 2px inset {self.border_light};
-                    border-right: 2px inset {self.border_light};
-                }}
-            """)
             self.send_btn.setToolTip("Send message")
             self.current_worker = None
     
@@ -519,9 +521,7 @@ class FileAdvisorGUI(QMainWindow):
         
         self.set_processing_state(False)
         # Replace "Thinking..." with cancelled message
-        html = self.chat_box.toHtml()
-        html = html.replace("Thinking...", "Request cancelled")
-        self.chat_box.setHtml(html)
+        self.chat_box.replace_thinking(self._thinking_html("Request cancelled"))
         self.chat_box.append(f"<span style='color:#ff6600; font-weight:bold; font-size:12px;'>CANCELLED:</span> <span style='color:#ff6600; font-weight:bold;'>Request cancelled by user</span>")
     def process_ai_reply(self, ai):
         """Process an AI reply and execute actions"""
@@ -534,6 +534,8 @@ class FileAdvisorGUI(QMainWindow):
 
 # Application entry point - create the window and start the event loop
 if __name__ == "__main__":
+    # INFO and up; the modules' logger.debug() calls are skipped without formatting
+    logging.basicConfig(level=logging.INFO)
     app = QApplication(sys.argv)
     app.setFont(QFont("Courier New", 10))
 
@@ -6,9 +6,10 @@ These functions work with the memory manager and permissions store.
 """
 
 from pathlib import Path
-from PyQt6.QtWidgets import QListWidget, QListWidgetItem
 from PyQt6.QtCore import Qt
 
+from list_models import CategoriesModel
+
 
 def add_category(category_name: str, memory) -> bool:
     """Add a new category to memory.
@@ -88,6 +89,9 @@ def auto_add_directory_categories(perms, memory) -> None:
     if categories_to_remove:
         memory.save()
     
+    # Saved once after the scan, if any category was added or its path changed
+    categories = memory.data["categories"]
+    changed = False
     try:
         # Scan subdirectories of the root (NOT the root itself)
         for item in root_path.iterdir():
@@ -97,25 +101,27 @@ def auto_add_directory_categories(perms, memory) -> None:
                 # Make sure we're not adding the root directory itself
                 if folder_name and folder_name != root_name:
                     # Add or update the category (even if it exists, update the path)
-                    memory.data["categories"][folder_name] = str(item)
-                    memory.save()
+                    item_path = str(item)
+                    if categories.get(folder_name) != item_path:
+                        categories[folder_name] = item_path
+                        changed = True
     except (PermissionError, OSError):
         # Silently skip directories we can't access
         pass
+    finally:
+        if changed:
+            memory.save()
 
 
-def refresh_categories_list(categories_list: QListWidget, memory) -> None:
-    """Refresh the categories list widget with current categories from memory.
+def refresh_categories_list(categories_model: CategoriesModel, memory) -> None:
+    """Refresh the categories list model with current categories from memory.
     
     Args:
-        categories_list: QListWidget to populate
+        categories_model: CategoriesModel to populate
         memory: MemoryManager instance
     """
-    categories_list.clear()
     categories = memory.data.get("categories", {})
-    for cat in sorted(categories.keys()):
-        item = QListWidgetItem(cat)
-        categories_list.addItem(item)
+    categories_model.set_categories(sorted(categories))
 
 
 def remove_category(category_name: str, memory) -> bool:
@@ -30,6 +30,9 @@ DEFAULT_ALLOWED_ROOTS: List[Path] = [
 # DEFAULT AI MODEL
 DEFAULT_AI_MODEL: str = "llama3.1:8b"
 
+# OLLAMA GENERATE ENDPOINT
+OLLAMA_GENERATE_URL: str = "http://localhost:11434/api/generate"
+
 # POPULAR AI MODELS (for easy switching)
 POPULAR_MODELS: List[str] = [
     "llama3.1:8b",
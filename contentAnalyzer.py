@@ -2,10 +2,30 @@
 Content Analyzer - Analyze file content and store summaries, chunks, and keywords
 Uses hybrid storage: summaries for large files, chunks for small files, keywords for all
 """
+import json
 import re
-from typing import Dict, Optional, List
+from pathlib import Path
+from typing import Dict, Optional, List, Tuple
 import requests
-from config import get_ai_model
+from config import OLLAMA_GENERATE_URL, get_ai_model
+
+
+# Most Ollama requests callers should have in flight at once (e.g. worker threads)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Shared HTTP session so repeated Ollama calls reuse keep-alive connections;
+# the pool is sized so concurrent callers don't open and drop extra sockets
+_session = requests.Session()
+_session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS))
+
+# Files below this size (and content length) store a chunk instead of an AI summary
+SUMMARY_SIZE_THRESHOLD = 10 * 1024  # 10KB
+
+# Characters of each document sent in a batched summary prompt
+BATCH_SNIPPET_CHARS = 2000
+
+# Number of files whose content analysis is sent to Ollama in one request
+ANALYSIS_BATCH_SIZE = 8
 
 
 def extract_keywords(text: str, max_keywords: int = 15) -> List[str]:
@@ -46,7 +66,7 @@ def extract_keywords(text: str, max_keywords: int = 15) -> List[str]:
     return keywords
 
 
-def generate_summary(content: str, ai_url: str = "http://localhost:11434/api/generate", 
+def generate_summary(content: str, ai_url: str = OLLAMA_GENERATE_URL, 
                      model: Optional[str] = None) -> Optional[str]:
     """
     Generate an AI summary of the content using Ollama.
@@ -67,7 +87,7 @@ def generate_summary(content: str, ai_url: str = "http://localhost:11434/api/gen
 Summary:"""
     
     try:
-        response = requests.post(
+        response = _session.post(
             ai_url,
             json={
                 "model": model,
@@ -95,9 +115,75 @@ Summary:"""
     return None
 
 
+def generate_summaries_batch(contents: List[str],
+                             ai_url: str = OLLAMA_GENERATE_URL,
+                             model: Optional[str] = None) -> List[Optional[str]]:
+    """
+    Generate summaries for several documents with a single Ollama request.
+    Returns one summary (or None) per input, in order. Falls back to
+    per-document generate_summary() calls if the batched reply can't be parsed.
+    """
+    if model is None:
+        model = get_ai_model()
+    if not contents:
+        return []
+    if len(contents) == 1:
+        return [generate_summary(contents[0], ai_url, model)]
+    
+    documents = "\n\n".join(
+        f"--- Document {i} ---\n{content[:BATCH_SNIPPET_CHARS]}"
+        for i, content in enumerate(contents, 1)
+    )
+    prompt = f"""Summarize each of the following {len(contents)} documents in 2-3 sentences. Focus on the main topic, purpose, and key information.
+Respond with ONLY a JSON array of {len(contents)} strings, one summary per document, in the same order.
+
+{documents}
+
+JSON array:"""
+    
+    try:
+        response = _session.post(
+            ai_url,
+            json={
+                "model": model,
+                "prompt": prompt,
+                "stream": False,
+                "options": {
+                    "temperature": 0.3,
+                    "num_predict": 150 * len(contents),  # ~150 tokens per summary
+                    "num_ctx": 8192  # Room for all snippets in one prompt
+                }
+            },
+            timeout=30 * len(contents)
+        )
+        
+        if response.status_code == 200:
+            raw = response.json().get("response", "")
+            start = raw.find("[")
+            end = raw.rfind("]")
+            if start != -1 and end > start:
+                summaries = json.loads(raw[start:end + 1])
+                if isinstance(summaries, list) and len(summaries) == len(contents):
+                    return [
+                        str(summary).strip()[:500] if summary else None  # Limit to 500 chars
+                        for summary in summaries
+                    ]
+    except Exception:
+        # Batched request or parse failed - fall back to one request per document
+        pass
+    
+    return [generate_summary(content, ai_url, model) for content in contents]
+
+
+def needs_summary(content: str, file_size: int) -> bool:
+    """Large files get an AI summary; small files just store a chunk."""
+    return not (file_size < SUMMARY_SIZE_THRESHOLD and len(content) < 10000)
+
+
 def analyze_content(content_data: Dict, file_size: int = 0, 
-                    ai_url: str = "http://localhost:11434/api/generate",
-                    model: Optional[str] = None) -> Dict:
+                    ai_url: str = OLLAMA_GENERATE_URL,
+                    model: Optional[str] = None,
+                    summarize: bool = True) -> Dict:
     """
     Analyze file content and return structured data with summary, keywords, and optionally chunks.
     
@@ -106,6 +192,7 @@ def analyze_content(content_data: Dict, file_size: int = 0,
         file_size: Size of the file in bytes
         ai_url: URL for Ollama API
         model: Model name for Ollama
+        summarize: If False, skip the AI summary request (the caller batches it)
     
     Returns:
         Dict with:
@@ -155,26 +242,39 @@ def analyze_content(content_data: Dict, file_size: int = 0,
     result["keywords"] = keywords
     
     # Determine storage strategy based on file size
-    size_threshold = 10 * 1024  # 10KB
-    
-    if file_size < size_threshold and len(content) < 10000:
+    if not needs_summary(content, file_size):
         # Small file: store chunk
         chunk_length = min(1000, len(content))
         result["chunk"] = content[:chunk_length]
     else:
         # Large file: generate summary
-        summary = generate_summary(content, ai_url, model)
-        if summary:
-            result["summary"] = summary
+        if summarize:
+            summary = generate_summary(content, ai_url, model)
+            if summary:
+                result["summary"] = summary
         # Also store a small chunk for context
         result["chunk"] = content[:500]
     
     return result
 
 
+def _get_file_size(file_info: Dict) -> int:
+    """Return the on-disk size of file_info["full_path"], or 0 if unavailable."""
+    full_path = file_info.get("full_path", "")
+    if not full_path:
+        return 0
+    try:
+        # One stat; a missing file raises instead of needing an exists() check first
+        return Path(full_path).stat().st_size
+    except (OSError, ValueError):
+        return 0
+
+
 def analyze_file(file_info: Dict, content_data: Optional[Dict], 
-                 ai_url: str = "http://localhost:11434/api/generate",
-                 model: Optional[str] = None) -> Dict:
+                 ai_url: str = OLLAMA_GENERATE_URL,
+                 model: Optional[str] = None,
+                 summarize: bool = True,
+                 file_size: Optional[int] = None) -> Dict:
     """
     Analyze a file and add content analysis to file_info.
     
@@ -183,6 +283,8 @@ def analyze_file(file_info: Dict, content_data: Optional[Dict],
         content_data: Result from contentReader.read_file_content() or None
         ai_url: URL for Ollama API
         model: Model name for Ollama
+        summarize: If False, skip the AI summary request (the caller batches it)
+        file_size: Size in bytes if the caller already has it; stat'ed otherwise
     
     Returns:
         Updated file_info with "content" key added (if content_data provided)
@@ -193,18 +295,11 @@ def analyze_file(file_info: Dict, content_data: Optional[Dict],
         return file_info
     
     # Get file size
-    try:
-        from pathlib import Path
-        file_path = Path(file_info.get("full_path", ""))
-        if file_path.exists():
-            file_size = file_path.stat().st_size
-        else:
-            file_size = 0
-    except:
-        file_size = 0
+    if file_size is None:
+        file_size = _get_file_size(file_info)
     
     # Analyze content
-    analysis = analyze_content(content_data, file_size, ai_url, model)
+    analysis = analyze_content(content_data, file_size, ai_url, model, summarize=summarize)
     
     # Add to file_info
     file_info["content"] = analysis
@@ -217,3 +312,44 @@ def analyze_file(file_info: Dict, content_data: Optional[Dict],
     
     return file_info
 
+
+def analyze_files_batch(batch: List[Tuple[Dict, Optional[Dict]]],
+                        ai_url: str = OLLAMA_GENERATE_URL,
+                        model: Optional[str] = None) -> List[Dict]:
+    """
+    Analyze several files at once, sharing a single Ollama request for the
+    summaries of all large files in the batch.
+    
+    Args:
+        batch: List of (file_info, content_data) pairs
+        ai_url: URL for Ollama API
+        model: Model name for Ollama
+    
+    Returns:
+        List of updated file_info dicts (updated in place), in input order
+    """
+    if model is None:
+        model = get_ai_model()
+    
+    results = []
+    to_summarize = []  # (file_info, content) pairs for large files
+    for file_info, content_data in batch:
+        if content_data is None:
+            results.append(file_info)
+            continue
+        # Stat'ed once, for both the analysis and the summary decision
+        file_size = _get_file_size(file_info)
+        file_info = analyze_file(file_info, content_data, ai_url, model,
+                                 summarize=False, file_size=file_size)
+        results.append(file_info)
+        content = content_data.get("content", "")
+        if content and len(content) >= 50 and needs_summary(content, file_size):
+            to_summarize.append((file_info, content))
+    
+    if to_summarize:
+        summaries = generate_summaries_batch([content for _, content in to_summarize], ai_url, model)
+        for (file_info, _), summary in zip(to_summarize, summaries):
+            if summary:
+                file_info["content"]["summary"] = summary
+    
+    return results
@@ -8,6 +8,24 @@ from typing import Dict, Optional, List
 import json
 
 
+# Known binary file types that we shouldn't try to read as text
+BINARY_EXTENSIONS = frozenset({
+    '.exe', '.dll', '.so', '.dylib', '.bin', '.dat', '.db', '.sqlite',
+    '.sqlite3', '.db3', '.mdb', '.accdb', '.psd', '.ai', '.sketch',
+    '.dmg', '.iso', '.img', '.deb', '.rpm', '.pkg', '.apk', '.ipa',
+    '.app', '.framework', '.bundle', '.kext', '.a', '.lib',
+    '.o', '.obj', '.class', '.pyc', '.pyo', '.pyd',
+    '.woff', '.woff2', '.ttf', '.otf', '.eot', '.mp3', '.mp4', '.avi',
+    '.mov', '.wmv', '.flv', '.mkv', '.webm', '.m4a', '.wav', '.flac',
+    '.ogg', '.aac', '.wma', '.zip', '.rar', '.7z', '.tar', '.gz',
+    '.bz2', '.xz', '.z', '.lz', '.lzma', '.cab', '.msi',
+    '.vmdk', '.vdi', '.vhd', '.vhdx',
+})
+
+# Archive types listed when "archives" content reading is enabled
+ARCHIVE_EXTENSIONS = frozenset({'.zip', '.tar', '.tar.gz', '.tgz', '.rar', '.7z'})
+
+
 def read_text_file(file_path: Path, max_size: int = 5 * 1024 * 1024) -> Optional[str]:
     """Read a text file, respecting max size limit."""
     try:
@@ -165,6 +183,18 @@ def read_archive_contents(file_path: Path) -> Optional[List[str]]:
         return None
 
 
+def can_read_content(file_type: str, enabled_types) -> bool:
+    """
+    Cheap pre-check for read_file_content(): False when the extension would be
+    skipped outright (a binary type that no enabled reader handles), so callers
+    can avoid the call entirely.
+    """
+    file_type_lower = file_type.lower()
+    if file_type_lower not in BINARY_EXTENSIONS:
+        return True
+    return "archives" in enabled_types and file_type_lower in ARCHIVE_EXTENSIONS
+
+
 def read_file_content(file_path: Path, file_type: str, config: Dict) -> Optional[Dict]:
     """
     Read file content based on file type and user configuration.
@@ -190,18 +220,6 @@ def read_file_content(file_path: Path, file_type: str, config: Dict) -> Optional
     file_type_lower = file_type.lower()
     result = {}
     
-    # Known binary file types that we shouldn't try to read as text
-    binary_extensions = {'.exe', '.dll', '.so', '.dylib', '.bin', '.dat', '.db', '.sqlite', 
-                         '.sqlite3', '.db3', '.mdb', '.accdb', '.psd', '.ai', '.sketch',
-                         '.dmg', '.iso', '.img', '.deb', '.rpm', '.pkg', '.apk', '.ipa',
-                         '.app', '.framework', '.bundle', '.kext', '.dylib', '.a', '.lib',
-                         '.o', '.obj', '.class', '.pyc', '.pyo', '.pyd', '.so', '.dll',
-                         '.woff', '.woff2', '.ttf', '.otf', '.eot', '.mp3', '.mp4', '.avi',
-                         '.mov', '.wmv', '.flv', '.mkv', '.webm', '.m4a', '.wav', '.flac',
-                         '.ogg', '.aac', '.wma', '.zip', '.rar', '.7z', '.tar', '.gz',
-                         '.bz2', '.xz', '.z', '.lz', '.lzma', '.cab', '.msi', '.pkg',
-                         '.dmg', '.iso', '.img', '.vmdk', '.vdi', '.vhd', '.vhdx'}
-    
     # PDFs
     if "pdf" in enabled_types and file_type_lower == '.pdf':
         content = read_pdf(file_path, max_size)
@@ -235,8 +253,7 @@ def read_file_content(file_path: Path, file_type: str, config: Dict) -> Optional
             return result
     
     # Archives
-    if "archives" in enabled_types and file_type_lower in ['.zip', '.tar', '.tar.gz', '.tgz', 
-                                                            '.rar', '.7z']:
+    if "archives" in enabled_types and file_type_lower in ARCHIVE_EXTENSIONS:
         contents = read_archive_contents(file_path)
         if contents is not None:
             result["archive_contents"] = contents
@@ -245,7 +262,7 @@ def read_file_content(file_path: Path, file_type: str, config: Dict) -> Optional
     
     # Try to read as text for any file type (if text reading is enabled)
     # Skip known binary files, but try to read everything else as text
-    if "text" in enabled_types and file_type_lower not in binary_extensions:
+    if "text" in enabled_types and file_type_lower not in BINARY_EXTENSIONS:
         content = read_text_file(file_path, max_size)
         if content is not None:
             result["content"] = content
@@ -255,7 +272,7 @@ def read_file_content(file_path: Path, file_type: str, config: Dict) -> Optional
     # Last resort: if content reading is enabled but text reading wasn't enabled,
     # still try reading as text for unknown file types (unless it's a known binary type)
     # This ensures we at least try to read files even if they're not in the enabled types list
-    if file_type_lower not in binary_extensions:
+    if file_type_lower not in BINARY_EXTENSIONS:
         content = read_text_file(file_path, max_size)
         if content is not None:
             result["content"] = content
@@ -5,7 +5,7 @@ Contains dialog windows used throughout the application, including PreviewDialog
 for showing pending file operations before execution.
 """
 
-from typing import List
+from typing import Callable, Dict, List
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTextBrowser
 )
@@ -16,56 +16,96 @@ from PyQt6.QtWidgets import (
 # approve or cancel actions before they happen.
 class PreviewDialog(QDialog):
     """Dialog to show preview of pending file operations before execution"""
+
+    # Style sheet shared by every instance, scoped by object name so Qt can
+    # reuse the parsed rules instead of re-parsing them per widget.
+    _QSS = """
+        QDialog#PreviewDialog QLabel#title {
+            font-family: 'Courier New', 'Monaco', monospace;
+            font-size: 14px;
+            font-weight: bold;
+            padding: 10px;
+            background-color: #e6f2ff;
+            border: 2px inset #808080;
+        }
+        QDialog#PreviewDialog QLabel#info {
+            font-family: 'Courier New', 'Monaco', monospace;
+            font-size: 11px;
+            padding: 8px;
+            background-color: #f0f0f0;
+            border: 1px solid #c0c0c0;
+        }
+        QDialog#PreviewDialog QTextBrowser#actionsList {
+            background-color: white;
+            border: 2px inset #808080;
+            font-family: 'Courier New', 'Monaco', monospace;
+            font-size: 11px;
+            padding: 10px;
+        }
+        QDialog#PreviewDialog QPushButton#cancelButton,
+        QDialog#PreviewDialog QPushButton#approveButton {
+            color: black;
+            border-radius: 0px;
+            font-size: 11px;
+            font-weight: bold;
+            padding: 8px 20px;
+            border-top: 2px outset #ffffff;
+            border-left: 2px outset #ffffff;
+            border-bottom: 2px outset #808080;
+            border-right: 2px outset #808080;
+        }
+        QDialog#PreviewDialog QPushButton#cancelButton {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #d4d0c8, stop:1 #c0c0c0);
+        }
+        QDialog#PreviewDialog QPushButton#cancelButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #e8e4dc, stop:1 #d4d0c8);
+        }
+        QDialog#PreviewDialog QPushButton#approveButton {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #90ee90, stop:1 #00cc00);
+        }
+        QDialog#PreviewDialog QPushButton#approveButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #a0ffa0, stop:1 #00ee00);
+        }
+        QDialog#PreviewDialog QPushButton#cancelButton:pressed,
+        QDialog#PreviewDialog QPushButton#approveButton:pressed {
+            border-top: 2px inset #808080;
+            border-left: 2px inset #808080;
+            border-bottom: 2px inset #ffffff;
+            border-right: 2px inset #ffffff;
+        }
+    """
+
     def __init__(self, actions: List[dict], parent=None):
         super().__init__(parent)
         self.actions = actions
         self.approved = False
+        self.setObjectName("PreviewDialog")
         self.setWindowTitle("Preview Actions")
         self.setMinimumWidth(700)
         self.setMinimumHeight(400)
+        self.setStyleSheet(PreviewDialog._QSS)
         
         layout = QVBoxLayout()
         
         # Title
         title = QLabel("Preview of File Operations")
-        title.setStyleSheet("""
-            QLabel {
-                font-family: 'Courier New', 'Monaco', monospace;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                background-color: #e6f2ff;
-                border: 2px inset #808080;
-            }
-        """)
+        title.setObjectName("title")
         layout.addWidget(title)
         
         # Instructions
         info = QLabel("Review the actions below. Click 'Approve & Run' to execute them, or 'Cancel' to abort.")
+        info.setObjectName("info")
         info.setWordWrap(True)
-        info.setStyleSheet("""
-            QLabel {
-                font-family: 'Courier New', 'Monaco', monospace;
-                font-size: 11px;
-                padding: 8px;
-                background-color: #f0f0f0;
-                border: 1px solid #c0c0c0;
-            }
-        """)
         layout.addWidget(info)
         
         # Actions list
         self.actions_list = QTextBrowser()
+        self.actions_list.setObjectName("actionsList")
         self.actions_list.setReadOnly(True)
-        self.actions_list.setStyleSheet("""
-            QTextBrowser {
-                background-color: white;
-                border: 2px inset #808080;
-                font-family: 'Courier New', 'Monaco', monospace;
-                font-size: 11px;
-                padding: 10px;
-            }
-        """)
         layout.addWidget(self.actions_list)
         
         # Populate actions
@@ -76,60 +116,12 @@ class PreviewDialog(QDialog):
         buttons_row.addStretch()
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #d4d0c8, stop:1 #c0c0c0);
-                color: black;
-                border-radius: 0px;
-                font-size: 11px;
-                font-weight: bold;
-                padding: 8px 20px;
-                border-top: 2px outset #ffffff;
-                border-left: 2px outset #ffffff;
-                border-bottom: 2px outset #808080;
-                border-right: 2px outset #808080;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e8e4dc, stop:1 #d4d0c8);
-            }
-            QPushButton:pressed {
-                border-top: 2px inset #808080;
-                border-left: 2px inset #808080;
-                border-bottom: 2px inset #ffffff;
-                border-right: 2px inset #ffffff;
-            }
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         buttons_row.addWidget(cancel_btn)
         
         approve_btn = QPushButton("Approve & Run")
-        approve_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #90ee90, stop:1 #00cc00);
-                color: black;
-                border-radius: 0px;
-                font-size: 11px;
-                font-weight: bold;
-                padding: 8px 20px;
-                border-top: 2px outset #ffffff;
-                border-left: 2px outset #ffffff;
-                border-bottom: 2px outset #808080;
-                border-right: 2px outset #808080;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #a0ffa0, stop:1 #00ee00);
-            }
-            QPushButton:pressed {
-                border-top: 2px inset #808080;
-                border-left: 2px inset #808080;
-                border-bottom: 2px inset #ffffff;
-                border-right: 2px inset #ffffff;
-            }
-        """)
+        approve_btn.setObjectName("approveButton")
         approve_btn.clicked.connect(self.accept)
         buttons_row.addWidget(approve_btn)
         
@@ -143,41 +135,66 @@ class PreviewDialog(QDialog):
             return
         
         html_parts = []
-        action_names = {
-            "list_files": "📁 List Files",
-            "list_all_files": "🔍 Scan All Files",
-            "read_file": "📄 Read File",
-            "move_file": "➡️ Move File",
-            "create_folder": "📂 Create Folder",
-            "file_type": "🔎 Check File Type"
-        }
-        
         for i, action in enumerate(self.actions, 1):
             action_type = action.get("action", "unknown")
             args = action.get("args", {})
-            action_display = action_names.get(action_type, action_type)
-            
-            html_parts.append(f"<div style='margin-bottom: 15px; padding: 10px; background-color: #f8f8f8; border: 1px solid #c0c0c0;'>")
-            html_parts.append(f"<strong style='color: #000080; font-size: 12px;'>{i}. {action_display}</strong><br>")
-            
-            if action_type == "move_file":
-                src = args.get("source") or args.get("src", "")
-                dst = args.get("destination") or args.get("dst", "")
-                html_parts.append(f"<span style='color: #333;'>From:</span> <code style='background: #e0e0e0; padding: 2px 4px;'>{src}</code><br>")
-                html_parts.append(f"<span style='color: #333;'>To:</span> <code style='background: #e0e0e0; padding: 2px 4px;'>{dst}</code>")
-            elif action_type == "create_folder":
-                path = args.get("path", "")
-                html_parts.append(f"<span style='color: #333;'>Path:</span> <code style='background: #e0e0e0; padding: 2px 4px;'>{path}</code>")
-            elif action_type in ["list_files", "list_all_files", "read_file", "file_type"]:
-                path = args.get("path", "")
-                if path:
-                    html_parts.append(f"<span style='color: #333;'>Path:</span> <code style='background: #e0e0e0; padding: 2px 4px;'>{path}</code>")
-                else:
-                    html_parts.append(f"<span style='color: #666;'>Will scan all accessible directories</span>")
-                if "limit" in args:
-                    html_parts.append(f"<br><span style='color: #333;'>Limit:</span> {args['limit']} items")
-            
-            html_parts.append("</div>")
+            action_display = _ACTION_NAMES.get(action_type, action_type)
+            renderer = _RENDERERS.get(action_type, _render_generic)
+            html_parts.append(
+                f"<div style='margin-bottom: 15px; padding: 10px; background-color: #f8f8f8; border: 1px solid #c0c0c0;'>"
+                f"<strong style='color: #000080; font-size: 12px;'>{i}. {action_display}</strong><br>"
+                f"{renderer(args)}</div>"
+            )
         
         self.actions_list.setHtml("".join(html_parts))
 
+
+# Display names and per-action HTML renderers for PreviewDialog. Looking the
+# renderer up in a dict keeps _populate_actions a single O(1) dispatch per action.
+_ACTION_NAMES = {
+    "list_files": "📁 List Files",
+    "list_all_files": "🔍 Scan All Files",
+    "read_file": "📄 Read File",
+    "move_file": "➡️ Move File",
+    "create_folder": "📂 Create Folder",
+    "file_type": "🔎 Check File Type"
+}
+
+
+def _render_move(args: dict) -> str:
+    src = args.get("source") or args.get("src", "")
+    dst = args.get("destination") or args.get("dst", "")
+    return (
+        f"<span style='color: #333;'>From:</span> <code style='background: #e0e0e0; padding: 2px 4px;'>{src}</code><br>"
+        f"<span style='color: #333;'>To:</span> <code style='background: #e0e0e0; padding: 2px 4px;'>{dst}</code>"
+    )
+
+
+def _render_folder(args: dict) -> str:
+    path = args.get("path", "")
+    return f"<span style='color: #333;'>Path:</span> <code style='background: #e0e0e0; padding: 2px 4px;'>{path}</code>"
+
+
+def _render_path(args: dict) -> str:
+    path = args.get("path", "")
+    if path:
+        html = f"<span style='color: #333;'>Path:</span> <code style='background: #e0e0e0; padding: 2px 4px;'>{path}</code>"
+    else:
+        html = "<span style='color: #666;'>Will scan all accessible directories</span>"
+    if "limit" in args:
+        html += f"<br><span style='color: #333;'>Limit:</span> {args['limit']} items"
+    return html
+
+
+def _render_generic(args: dict) -> str:
+    return ""
+
+
+_RENDERERS: Dict[str, Callable[[dict], str]] = {
+    "move_file": _render_move,
+    "create_folder": _render_folder,
+    "list_files": _render_path,
+    "list_all_files": _render_path,
+    "read_file": _render_path,
+    "file_type": _render_path,
+}
@@ -0,0 +1,83 @@
+"""
+File Index - Keyword lookup over the indexed file list
+Keeps an inverted index (keyword -> row numbers in all_files) for the current
+file list so lookups by keyword, course code or subject don't scan every file.
+The index lives in memory only; it is rebuilt lazily and never saved to memory.json
+"""
+from typing import Dict, List
+
+# The all_files list the keyword index was built from, and the index itself
+# (None when it needs rebuilding)
+_keyword_index = {"files": None, "by_keyword": None}
+
+
+def build_keyword_index(all_files: List[Dict]) -> Dict[str, List[int]]:
+    """
+    Build an inverted index from lowercase keyword to row numbers in all_files.
+
+    Indexed terms per file:
+    - parsed filename keywords, course code and subject hints
+    - content keywords (if content analysis ran)
+    """
+    by_keyword = {}
+    for row, file_info in enumerate(all_files):
+        terms = set()
+
+        parsed = file_info.get("parsed") or {}
+        terms.update(kw.lower() for kw in parsed.get("keywords", []) if kw)
+        if parsed.get("course"):
+            terms.add(parsed["course"].lower())
+        terms.update(subject.lower() for subject in parsed.get("subject_hints", []) if subject)
+
+        content = file_info.get("content") or {}
+        terms.update(kw.lower() for kw in content.get("keywords", []) if kw)
+
+        for term in terms:
+            by_keyword.setdefault(term, []).append(row)
+    return by_keyword
+
+
+def invalidate_keyword_index() -> None:
+    """
+    Mark the keyword index stale so the next lookup rebuilds it.
+
+    Call this when entries already in all_files gain parsed or content data.
+    """
+    _keyword_index["by_keyword"] = None
+
+
+def set_all_files(file_index: Dict, all_files: List[Dict]) -> None:
+    """Store all_files in file_index; the keyword index is rebuilt on the next lookup."""
+    file_index["all_files"] = all_files
+    # Older versions saved the keyword index into memory.json here
+    file_index.pop("by_keyword", None)
+    invalidate_keyword_index()
+
+
+def root_files_without_notes(all_files: List[Dict], file_notes: Dict) -> List[Dict]:
+    """
+    Return the root-level files (no folder in their relative path) that have no
+    note yet, in one pass over all_files.
+    """
+    files_to_note = []
+    for f in all_files:
+        path = str(f.get("path", ""))
+        if "/" not in path and path not in file_notes:
+            files_to_note.append(f)
+    return files_to_note
+
+
+def find_files(file_index: Dict, keyword: str) -> List[Dict]:
+    """
+    Return the file_info dicts indexed under keyword (case-insensitive).
+
+    Builds the keyword index on first use, after a new file list is stored
+    or loaded, and after invalidate_keyword_index().
+    """
+    all_files = file_index.get("all_files", [])
+    by_keyword = _keyword_index["by_keyword"]
+    if by_keyword is None or _keyword_index["files"] is not all_files:
+        by_keyword = build_keyword_index(all_files)
+        _keyword_index["files"] = all_files
+        _keyword_index["by_keyword"] = by_keyword
+    return [all_files[row] for row in by_keyword.get(keyword.lower(), ()) if row < len(all_files)]
@@ -5,15 +5,18 @@ Functions for scanning files and building the file index for AI context.
 """
 
 import os
+import sys
 import time
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QProgressDialog, QApplication
 
+from config import OLLAMA_GENERATE_URL, get_ai_model
+from fileIndex import set_all_files, root_files_without_notes
 from filenameParser import parse_file_info
-from contentReader import read_file_content
-from contentAnalyzer import analyze_file
+from contentReader import read_file_content, can_read_content
+from contentAnalyzer import analyze_files_batch, ANALYSIS_BATCH_SIZE
 from workers import IndexingWorker
 
 
@@ -23,18 +26,17 @@ def scan_all_files_for_ai(gui_instance):
     Args:
         gui_instance: The FileAdvisorGUI instance
     """
-    # Clear old file index first
-    if "file_index" not in gui_instance.memory.data:
-        gui_instance.memory.data["file_index"] = {}
-    gui_instance.memory.data["file_index"]["all_files"] = []
-    gui_instance.memory.data["file_index"]["last_scan"] = None
-    
-    if not gui_instance.perms.allowed_root or not gui_instance.perms.allowed_root.exists():
-        # No root directory - clear the index and save
-        gui_instance.memory.save()
-        return
+    # Clear old file index first - only mark memory dirty if something actually changed
+    file_index = gui_instance.memory.data.setdefault("file_index", {})
+    dirty = bool(file_index.get("all_files")) or file_index.get("last_scan") is not None
+    set_all_files(file_index, [])
+    file_index["last_scan"] = None
     
     try:
+        if not gui_instance.perms.allowed_root or not gui_instance.perms.allowed_root.exists():
+            # No root directory - the cleared index is saved below if it changed
+            return
+        
         # Scan all files recursively
         all_files = []
         root_path = gui_instance.perms.allowed_root
@@ -48,26 +50,51 @@ def scan_all_files_for_ai(gui_instance):
                 "max_file_size": 5 * 1024 * 1024
             }
         
+        # Unpack content settings once instead of per file
+        content_enabled = bool(content_config.get("enabled", False))
+        enabled_types = frozenset(content_config.get("enabled_types", []))
+        
         # Get AI model info for content analysis
-        from config import get_ai_model
-        ai_url = "http://localhost:11434/api/generate"
+        ai_url = OLLAMA_GENERATE_URL
         ai_model = get_ai_model()
         
+        # Files with content waiting to be analyzed in a single batched request
+        pending_analysis = []
+        
+        def flush_pending_analysis():
+            if not pending_analysis:
+                return
+            try:
+                analyze_files_batch(pending_analysis, ai_url, ai_model)
+            except Exception:
+                # Content analysis failed, but files are still indexed with filename info
+                pass
+            pending_analysis.clear()
+        
+        # os.walk() yields directories as strings prefixed by the root, so relative
+        # paths can be sliced off instead of building Path objects per file
+        root_str = str(root_path)
+        root_prefix_len = len(root_str) if root_str.endswith(os.sep) else len(root_str) + 1
+        
         for root, dirs, files in os.walk(root_path):
             # Skip hidden files/directories
             dirs[:] = [d for d in dirs if not d.startswith('.')]
             files = [f for f in files if not f.startswith('.')]
             
             for file in files:
-                file_path = Path(root) / file
+                file_path = os.path.join(root, file)
                 try:
                     # Get relative path from root
-                    relative_path = file_path.relative_to(root_path)
+                    relative_path = file_path[root_prefix_len:]
+                    # Same rules as Path.suffix: no extension for a trailing dot
+                    dot = file.rfind('.')
+                    # Interned: thousands of entries share a handful of extensions
+                    extension = sys.intern(file[dot:].lower()) if 0 < dot < len(file) - 1 else ""
                     file_info = {
-                        "path": str(relative_path),
+                        "path": relative_path,
                         "name": file,
-                        "full_path": str(file_path),
-                        "extension": file_path.suffix.lower()
+                        "full_path": file_path,
+                        "extension": extension
                     }
                     
                     # Step 1: Parse filename (ALWAYS do this - it's fast and provides basic info)
@@ -79,10 +106,10 @@ def scan_all_files_for_ai(gui_instance):
                     
                     # Step 2: Try to read content if enabled (but don't fail if it doesn't work)
                     content_data = None
-                    if content_config.get("enabled", False):
+                    if content_enabled and can_read_content(extension, enabled_types):
                         try:
                             content_data = read_file_content(
-                                file_path,
+                                Path(file_path),
                                 file_info["extension"],
                                 content_config
                             )
@@ -90,42 +117,38 @@ def scan_all_files_for_ai(gui_instance):
                             # Content reading failed, but file is still indexed with filename info
                             content_data = None
                     
-                    # Step 3: Analyze content if we have content data (skip if slow/optional)
-                    if content_data:
-                        try:
-                            file_info = analyze_file(
-                                file_info,
-                                content_data,
-                                ai_url,
-                                ai_model
-                            )
-                        except Exception:
-                            # Content analysis failed, but file is still indexed with filename info
-                            pass
-                    
                     # ALWAYS add file to index, even if content reading/analysis failed
                     all_files.append(file_info)
+                    
+                    # Step 3: Queue content analysis (file_info is updated in place when the batch runs)
+                    if content_data:
+                        pending_analysis.append((file_info, content_data))
+                        if len(pending_analysis) >= ANALYSIS_BATCH_SIZE:
+                            flush_pending_analysis()
                 except (ValueError, PermissionError):
                     # Skip files we can't access, but continue with others
                     continue
                 except Exception as e:
                     # Log error but continue with other files - don't let one bad file stop indexing
                     if hasattr(gui_instance, 'log_box'):
-                        gui_instance.log_box.append(f"<span style='color:#ff6600; font-weight:bold; font-size:11px;'>Error processing {file}: {str(e)}</span>")
+                        gui_instance.log_append(f"Error processing {file}: {str(e)}", "warn")
                     continue
         
-        # Store in memory (overwrites the empty array we set earlier)
-        gui_instance.memory.data["file_index"]["all_files"] = all_files
-        gui_instance.memory.data["file_index"]["last_scan"] = time.time()
-        gui_instance.memory.data["file_index"]["root_path"] = str(root_path)  # Store which root this index is for
+        # Analyze whatever is left in the last partial batch
+        flush_pending_analysis()
         
-        # Save file notes if any were auto-generated
-        gui_instance.memory.save()
-    except Exception as e:
-        # Silently fail - don't block startup
-        # But ensure we save the cleared state
-        gui_instance.memory.save()
+        # Store in memory (overwrites the empty array we set earlier)
+        set_all_files(file_index, all_files)
+        file_index["last_scan"] = time.time()
+        file_index["root_path"] = str(root_path)  # Store which root this index is for
+        dirty = True
+    except Exception:
+        # Silently fail - don't block startup (the cleared state is still saved)
         pass
+    finally:
+        # Single save for every exit path
+        if dirty:
+            gui_instance.memory.save()
 
 
 def start_indexing(gui_instance):
@@ -149,9 +172,9 @@ def start_indexing(gui_instance):
     if gui_instance.perms.allowed_root and gui_instance.perms.allowed_root.exists():
         try:
             for root, dirs, files in os.walk(gui_instance.perms.allowed_root):
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                files = [f for f in files if not f.startswith('.')]
-                actual_file_count += len(files)
+                dirs[:] = [d for d in dirs if d[0] != '.']
+                # Count non-hidden files without building a filtered list
+                actual_file_count += sum(1 for f in files if f[0] != '.')
         except (PermissionError, OSError):
             actual_file_count = 0
     
@@ -169,11 +192,9 @@ def start_indexing(gui_instance):
     
     if index_valid:
         # Index is valid, only generate missing notes
-        root_files = [f for f in all_files if "/" not in f.get("path", "") or f.get("path", "").count("/") == 0]
+        # Same filter the IndexingWorker's note phase uses
         existing_notes = gui_instance.memory.data.get("file_notes", {})
-        files_needing_notes = [f for f in root_files if str(f.get("path", "")) not in existing_notes]
-        
-        if not files_needing_notes:
+        if not root_files_without_notes(all_files, existing_notes):
             # Everything is up to date, no need to run
             if hasattr(gui_instance, 'notes_list'):
                 gui_instance._refresh_notes_list()
@@ -192,26 +213,30 @@ def start_indexing(gui_instance):
     gui_instance.indexing_progress.resize(400, 120)
     
     # Style the progress dialog to match Windows 95 theme
+    bg, panel, text, border_dark, border_light = (
+        gui_instance.bg, gui_instance.panel, gui_instance.text,
+        gui_instance.border_dark, gui_instance.border_light,
+    )
     gui_instance.indexing_progress.setStyleSheet(f"""
         QDialog {{
-            background-color: {gui_instance.bg};
-            border: 2px outset {gui_instance.border_light};
+            background-color: {bg};
+            border: 2px outset {border_light};
         }}
         QLabel {{
-            background-color: {gui_instance.panel};
-            color: {gui_instance.text};
-            border: 1px inset {gui_instance.border_dark};
+            background-color: {panel};
+            color: {text};
+            border: 1px inset {border_dark};
             padding: 4px;
             font-size: 10px;
             font-family: 'Courier New', 'Monaco', monospace;
         }}
         QProgressBar {{
-            border: 2px inset {gui_instance.border_dark};
-            background-color: {gui_instance.panel};
+            border: 2px inset {border_dark};
+            background-color: {panel};
             text-align: center;
             font-size: 9px;
             font-family: 'Courier New', 'Monaco', monospace;
-            color: {gui_instance.text};
+            color: {text};
         }}
         QProgressBar::chunk {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
@@ -221,15 +246,15 @@ def start_indexing(gui_instance):
         QPushButton {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #d4d0c8, stop:1 #c0c0c0);
-            border: 1px outset {gui_instance.border_light};
-            color: {gui_instance.text};
+            border: 1px outset {border_light};
+            color: {text};
             font-size: 9px;
             font-family: 'Courier New', 'Monaco', monospace;
             padding: 3px 8px;
             min-width: 60px;
         }}
         QPushButton:pressed {{
-            border: 1px inset {gui_instance.border_dark};
+            border: 1px inset {border_dark};
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #c0c0c0, stop:1 #d4d0c8);
         }}
@@ -241,8 +266,15 @@ def start_indexing(gui_instance):
     
     # Create and start worker
     gui_instance.indexing_worker = IndexingWorker(gui_instance.perms, gui_instance.memory, skip_indexing=index_valid)
-    gui_instance.indexing_worker.progress.connect(gui_instance._on_indexing_progress)
     gui_instance.indexing_worker.finished.connect(gui_instance._on_indexing_finished)
+    
+    # Poll worker progress at ~20 Hz instead of repainting the dialog for every file
+    if gui_instance.indexing_progress_timer is None:
+        gui_instance.indexing_progress_timer = QTimer(gui_instance)
+        gui_instance.indexing_progress_timer.setInterval(50)
+        gui_instance.indexing_progress_timer.timeout.connect(gui_instance._on_indexing_progress)
+    gui_instance.indexing_progress_timer.start()
+    
     gui_instance.indexing_worker.start()
 
 
@@ -2,12 +2,21 @@
 Filename Parser - Extract structured information from filenames
 Extracts keywords, dates, course codes, file types, and subject hints
 """
+import os
 import re
-from pathlib import Path
-from typing import Dict, List, Optional
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
+# Extensions whose filenames carry no course/date/subject signal (build
+# artifacts, caches, logs). These skip the regex pipeline entirely.
+_SKIP_EXTS = frozenset({
+    '.pyc', '.pyo', '.o', '.so', '.dll', '.class', '.tmp', '.cache', '.log', '.lock'
+})
+
+
 def parse_filename(filename: str) -> Dict:
     """
     Parse a filename to extract structured information.
@@ -18,9 +27,44 @@ def parse_filename(filename: str) -> Dict:
     - type: File type indicator (e.g., "homework", "lecture", "notes")
     - date: Date if found in filename
     - subject_hints: List of subject/topic keywords
+    
+    Results are cached by filename, so repeated basenames (README.md,
+    __init__.py, lecture templates) skip the regex work. A fresh dict is
+    returned on every call so callers may mutate it freely.
     """
+    keywords, course, file_type, date, subject_hints = _parse_filename_cached(filename)
+    return {
+        "keywords": list(keywords),
+        "course": course,
+        "type": file_type,
+        "date": date,
+        "subject_hints": list(subject_hints)
+    }
+
+
+@lru_cache(maxsize=16384)
+def _parse_filename_cached(filename: str) -> Tuple:
+    """Parse a filename and freeze the result into an immutable tuple for caching."""
+    parsed = _parse_filename_uncached(filename)
+    return (
+        tuple(parsed["keywords"]),
+        parsed["course"],
+        parsed["type"],
+        parsed["date"],
+        tuple(parsed["subject_hints"])
+    )
+
+
+def clear_filename_cache() -> None:
+    """Drop cached parse results (e.g. when the root directory changes)."""
+    _parse_filename_cached.cache_clear()
+
+
+def _parse_filename_uncached(filename: str) -> Dict:
+    """Parse a filename without consulting the cache. See parse_filename()."""
+    # str.lower() already takes CPython's ASCII fast path for typical filenames,
+    # so lowercase once and reuse it everywhere below
     name_lower = filename.lower()
-    name_no_ext = Path(filename).stem.lower()
     
     parsed = {
         "keywords": [],
@@ -112,34 +156,50 @@ def parse_filename(filename: str) -> Dict:
         "art": ["art", "design", "drawing", "painting", "creative"],
     }
     
+    # Track keywords/subjects in sets so membership checks stay O(1)
+    kw_set = set(parsed["keywords"])
+    subject_set = set()
+    
     for subject, keywords in subject_keywords.items():
         for keyword in keywords:
             if keyword in name_lower:
-                if subject not in parsed["subject_hints"]:
-                    parsed["subject_hints"].append(subject)
-                if keyword not in parsed["keywords"]:
-                    parsed["keywords"].append(keyword)
+                subject_set.add(subject)
+                kw_set.add(keyword)
     
     # Extract additional keywords (numbers, common words)
     # Extract numbers that might be relevant (assignment numbers, versions, etc.)
     numbers = re.findall(r'\b\d+\b', filename)
     for num in numbers[:3]:  # Limit to first 3 numbers
-        if num not in parsed["keywords"] and len(num) <= 4:  # Skip very long numbers
-            parsed["keywords"].append(num)
+        if len(num) <= 4:  # Skip very long numbers
+            kw_set.add(num)
     
     # Extract common meaningful words (2+ chars, not too common)
     common_words = {"the", "and", "or", "of", "in", "on", "at", "to", "for", "a", "an"}
     words = re.findall(r'\b[a-z]{3,}\b', name_lower)
+    # Bucket the substring candidates (keywords longer than 3 chars) by length:
+    # a keyword can only contain the word if it is longer, only be contained in
+    # it if it is shorter, and an equal-length keyword would have to be equal
+    kw_by_len = defaultdict(list)
+    for kw in kw_set:
+        if len(kw) > 3:
+            kw_by_len[len(kw)].append(kw)
     for word in words:
-        if word not in common_words and word not in parsed["keywords"]:
+        if word not in common_words and word not in kw_set:
             # Only add if it's not already a part of a longer keyword
-            is_substring = any(word in kw or kw in word for kw in parsed["keywords"] if len(kw) > 3)
+            word_len = len(word)
+            is_substring = any(
+                (word in kw) if length > word_len else (kw in word)
+                for length, bucket in kw_by_len.items() if length != word_len
+                for kw in bucket
+            )
             if not is_substring:
-                parsed["keywords"].append(word)
+                kw_set.add(word)
+                if word_len > 3:
+                    kw_by_len[word_len].append(word)
     
-    # Remove duplicates and sort
-    parsed["keywords"] = sorted(list(set(parsed["keywords"])))
-    parsed["subject_hints"] = sorted(list(set(parsed["subject_hints"])))
+    # Sets are already deduplicated; just sort
+    parsed["keywords"] = sorted(kw_set)
+    parsed["subject_hints"] = sorted(subject_set)
     
     return parsed
 
@@ -158,6 +218,19 @@ def parse_file_info(file_info: Dict) -> Dict:
     if not filename:
         return file_info
     
+    extension = file_info.get("extension")
+    if extension is None:
+        extension = os.path.splitext(filename)[1].lower()
+    if extension in _SKIP_EXTS:
+        file_info["parsed"] = {
+            "keywords": [],
+            "course": None,
+            "type": None,
+            "date": None,
+            "subject_hints": []
+        }
+        return file_info
+    
     parsed_data = parse_filename(filename)
     file_info["parsed"] = parsed_data
     return file_info
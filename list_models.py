@@ -0,0 +1,69 @@
+"""
+LIST MODELS MODULE
+
+Qt list models behind the categories and file notes views in the preferences
+panel. Rows are plain Python data; item text is only built for the rows Qt
+actually asks about (the visible ones), and a refresh is one model reset
+rather than one insert per item.
+"""
+
+from typing import List, Tuple
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class CategoriesModel(QAbstractListModel):
+    """Category names, one per row."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._categories: List[str] = []
+
+    def set_categories(self, categories: List[str]) -> None:
+        """Replace every row with categories."""
+        self.beginResetModel()
+        self._categories = categories
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._categories)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._categories[index.row()]
+
+
+class NotesModel(QAbstractListModel):
+    """File notes as (file_path, file_name, note) rows.
+
+    DisplayRole is the file name over a short note preview, UserRole is the
+    full path (the file_notes key) and ToolTipRole shows path and full note.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, str, str]] = []
+
+    def set_rows(self, rows: List[Tuple[str, str, str]]) -> None:
+        """Replace every row with rows."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        file_path, file_name, note = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            # File name on first line, note preview (first 60 chars) below
+            note_preview = note if len(note) <= 60 else note[:57] + "..."
+            return f"{file_name}\n  {note_preview}"
+        if role == Qt.ItemDataRole.UserRole:
+            return file_path
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"File: {file_path}\nNote: {note}"
+        return None
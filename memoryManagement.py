@@ -1,6 +1,12 @@
 import json
 import os
 
+try:
+    # Optional: several times faster than the json module on a large file_index
+    import orjson
+except ImportError:
+    orjson = None
+
 class MemoryManager:
     def __init__(self, path="memory.json"):
         self.path = path
@@ -18,15 +24,27 @@ class MemoryManager:
 
     def load(self):
         if os.path.exists(self.path):
-            with open(self.path, "r") as f:
+            with open(self.path, "rb") as f:
                 try:
-                    self.data = json.load(f)
+                    raw = f.read()
+                    self.data = orjson.loads(raw) if orjson else json.loads(raw)
                 except:
                     pass  # corrupted file fallback
 
     def save(self):
-        with open(self.path, "w") as f:
-            json.dump(self.data, f, indent=4)
+        # Encoded in one call, by orjson if installed, else json.dumps without
+        # indent (the C encoder; json.dump streams through the pure-Python one).
+        # Writing a temp file and swapping it in means a crash mid-write can't
+        # truncate memory.json
+        if orjson:
+            # Non-string keys are stringified, as the json module does
+            raw = orjson.dumps(self.data, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            raw = json.dumps(self.data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_path, self.path)
 
     def remember_category(self, extension, category):
         self.data["file_preferences"][extension] = category
@@ -5,34 +5,75 @@ Helper functions for managing file notes (metadata for AI sorting).
 These functions work with the memory manager and file index.
 """
 
-from pathlib import Path
-from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton, QMessageBox, QProgressDialog, QApplication
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton, QMessageBox, QProgressDialog
 from PyQt6.QtCore import Qt
 
-from filenameParser import parse_file_info
-from contentReader import read_file_content
-from contentAnalyzer import analyze_file
+from fileIndex import invalidate_keyword_index
+from list_models import NotesModel
+from workers import NoteGenerationWorker
 
 
-def refresh_notes_list(notes_list: QListWidget, memory) -> None:
-    """Refresh the file notes list widget with current notes from memory.
+def refresh_notes_list(notes_model: NotesModel, memory) -> None:
+    """Refresh the file notes list model with current notes from memory.
     
     Args:
-        notes_list: QListWidget to populate
+        notes_model: NotesModel to populate
         memory: MemoryManager instance
     """
-    notes_list.clear()
     file_notes = memory.data.get("file_notes", {})
-    for file_path, note in sorted(file_notes.items()):
-        # Better formatting: file name on first line, note preview below
-        file_name = Path(file_path).name if "/" in file_path else file_path
-        # Truncate note for preview (first 60 chars)
-        note_preview = note if len(note) <= 60 else note[:57] + "..."
-        item_text = f"{file_name}\n  {note_preview}"
-        item = QListWidgetItem(item_text)
-        item.setData(Qt.ItemDataRole.UserRole, file_path)  # Store full path
-        item.setData(Qt.ItemDataRole.ToolTipRole, f"File: {file_path}\nNote: {note}")  # Full info in tooltip
-        notes_list.addItem(item)
+    
+    # Build row data once, then sort on the path string
+    rows = [(file_path, file_path.rsplit("/", 1)[-1], note) for file_path, note in file_notes.items()]
+    rows.sort(key=lambda row: row[0])
+    notes_model.set_rows(rows)
+
+
+# Edit-note stylesheets keyed by (bg, panel, text, border_dark, border_light)
+_STYLE_CACHE = {}
+
+
+def _edit_note_stylesheet(bg: str, panel: str, text: str, border_dark: str, border_light: str) -> str:
+    """Return the edit-note dialog stylesheet for a theme, building it once per theme."""
+    key = (bg, panel, text, border_dark, border_light)
+    style = _STYLE_CACHE.get(key)
+    if style is None:
+        style = f"""
+            QDialog {{
+                background-color: {bg};
+            }}
+            QLabel {{
+                color: {text};
+                font-size: 10px;
+                font-family: 'Courier New', 'Monaco', monospace;
+            }}
+            QPlainTextEdit {{
+                background-color: {panel};
+                color: {text};
+                border: 2px inset {border_dark};
+                font-size: 10px;
+                font-family: 'Courier New', 'Monaco', monospace;
+                padding: 4px;
+            }}
+            QPushButton {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #d4d0c8, stop:1 #c0c0c0);
+                border: 1px outset {border_light};
+                color: {text};
+                font-size: 9px;
+                font-family: 'Courier New', 'Monaco', monospace;
+                padding: 4px 12px;
+                min-width: 70px;
+            }}
+            QPushButton:pressed {{
+                border: 1px inset {border_dark};
+            }}
+            QPushButton:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #e0e0e0, stop:1 #d0d0d0);
+            }}
+        """
+        _STYLE_CACHE[key] = style
+    return style
 
 
 def edit_note_dialog(parent, file_path: str, current_note: str, theme_colors: dict) -> tuple:
@@ -51,47 +92,13 @@ def edit_note_dialog(parent, file_path: str, current_note: str, theme_colors: di
     dialog.setWindowTitle("Edit File Note")
     dialog.setMinimumSize(500, 300)
     
-    bg = theme_colors.get("bg", "#a8a8a8")
-    panel = theme_colors.get("panel", "#ffffff")
-    text = theme_colors.get("text", "#000000")
-    border_dark = theme_colors.get("border_dark", "#808080")
-    border_light = theme_colors.get("border_light", "#ffffff")
-    
-    dialog.setStyleSheet(f"""
-        QDialog {{
-            background-color: {bg};
-        }}
-        QLabel {{
-            color: {text};
-            font-size: 10px;
-            font-family: 'Courier New', 'Monaco', monospace;
-        }}
-        QPlainTextEdit {{
-            background-color: {panel};
-            color: {text};
-            border: 2px inset {border_dark};
-            font-size: 10px;
-            font-family: 'Courier New', 'Monaco', monospace;
-            padding: 4px;
-        }}
-        QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #d4d0c8, stop:1 #c0c0c0);
-            border: 1px outset {border_light};
-            color: {text};
-            font-size: 9px;
-            font-family: 'Courier New', 'Monaco', monospace;
-            padding: 4px 12px;
-            min-width: 70px;
-        }}
-        QPushButton:pressed {{
-            border: 1px inset {border_dark};
-        }}
-        QPushButton:hover {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #e0e0e0, stop:1 #d0d0d0);
-        }}
-    """)
+    dialog.setStyleSheet(_edit_note_stylesheet(
+        theme_colors.get("bg", "#a8a8a8"),
+        theme_colors.get("panel", "#ffffff"),
+        theme_colors.get("text", "#000000"),
+        theme_colors.get("border_dark", "#808080"),
+        theme_colors.get("border_light", "#ffffff"),
+    ))
     
     layout = QVBoxLayout()
     layout.setSpacing(8)
@@ -153,15 +160,25 @@ def remove_file_note(file_path: str, memory) -> bool:
     return False
 
 
-def generate_notes_for_files(perms, memory, parent_widget, theme_colors: dict) -> None:
+def generate_notes_for_files(perms, memory, parent_widget, theme_colors: dict, on_finished=None) -> None:
     """Generate notes for files that don't have notes yet.
     
+    The work runs on a NoteGenerationWorker thread; notes (and the parsed and
+    content data the worker added to index entries) are merged into memory and
+    saved on the UI thread in chunks as the worker produces them.
+    
     Args:
         perms: PermissionsStore instance
         memory: MemoryManager instance
         parent_widget: Parent widget for dialogs
         theme_colors: Dict with theme colors
+        on_finished: Optional callback run after the notes are saved
     """
+    # Only one note generation run at a time
+    running_worker = getattr(parent_widget, "note_worker", None)
+    if running_worker is not None and running_worker.isRunning():
+        return
+    
     if not perms.allowed_root or not perms.allowed_root.exists():
         QMessageBox.warning(parent_widget, "No Root Directory", "Please set a root directory in Permissions first.")
         return
@@ -175,7 +192,7 @@ def generate_notes_for_files(perms, memory, parent_widget, theme_colors: dict) -
         return
     
     # Filter to root-level files only (files to be sorted)
-    root_files = [f for f in all_files if "/" not in f.get("path", "") or f.get("path", "").count("/") == 0]
+    root_files = [f for f in all_files if "/" not in f.get("path", "")]
     
     if not root_files:
         QMessageBox.information(parent_widget, "No Root Files", "No files found in root directory to generate notes for.")
@@ -187,7 +204,8 @@ def generate_notes_for_files(perms, memory, parent_widget, theme_colors: dict) -
         memory.data["file_notes"] = {}
     
     # Only process files that don't have notes yet
-    files_to_process = [f for f in root_files if str(f.get("path", "")) not in existing_notes]
+    existing_paths = set(existing_notes)
+    files_to_process = [f for f in root_files if f.get("path", "") not in existing_paths]
     
     if not files_to_process:
         QMessageBox.information(parent_widget, "All Notes Generated", f"All {len(root_files)} file(s) already have notes. No new files to process.")
@@ -209,85 +227,51 @@ def generate_notes_for_files(perms, memory, parent_widget, theme_colors: dict) -
             "max_file_size": 5 * 1024 * 1024
         }
     
-    # Get AI model info for content analysis
-    from config import get_ai_model
-    ai_url = "http://localhost:11434/api/generate"
-    ai_model = get_ai_model()
+    worker = NoteGenerationWorker(perms.allowed_root, files_to_process, content_config)
+    parent_widget.note_worker = worker  # Keep a reference while the thread runs
+    
+    def on_progress(done, filename):
+        progress.setLabelText(f"Processing: {filename}")
+        progress.setValue(done)
     
-    root_path = perms.allowed_root
     notes_generated = 0
+    # Index entries by path, for merging the worker's updated copies back in
+    files_by_path = {f.get("path", ""): f for f in files_to_process}
     
-    for idx, file_info in enumerate(files_to_process):
-        if progress.wasCanceled():
-            break
-        
-        file_path_str = str(file_info.get("path", ""))
-        progress.setLabelText(f"Processing: {file_info.get('name', '')}")
-        progress.setValue(idx)
-        QApplication.processEvents()  # Update UI
+    def save_notes(notes, updates):
+        # Persist each chunk so a cancel or crash keeps the notes made so far
+        nonlocal notes_generated
+        for file_path_str, updated_info in updates.items():
+            file_info = files_by_path.get(file_path_str)
+            if file_info is not None:
+                file_info.update(updated_info)
+        if updates:
+            # Merged entries may have new parsed/content keywords
+            invalidate_keyword_index()
+        if notes:
+            memory.data["file_notes"].update(notes)
+            memory.save()
+            notes_generated += len(notes)
+    
+    def on_notes_done(notes, updates):
+        save_notes(notes, updates)
+        progress.setValue(len(files_to_process))
+        progress.close()
         
-        try:
-            # Get full path
-            full_path = Path(root_path) / file_path_str
-            if not full_path.exists():
-                continue
-            
-            # Ensure parsed data exists
-            if "parsed" not in file_info:
-                file_info = parse_file_info(file_info)
-            
-            # Read content if enabled and not already done
-            if "content" not in file_info:
-                content_data = None
-                if content_config.get("enabled", False):
-                    content_data = read_file_content(
-                        full_path,
-                        file_info.get("extension", ""),
-                        content_config
-                    )
-                if content_data:
-                    file_info = analyze_file(
-                        file_info,
-                        content_data,
-                        ai_url,
-                        ai_model
-                    )
-            
-            # Generate note
-            note_parts = []
-            
-            if file_info.get("parsed"):
-                parsed = file_info["parsed"]
-                if parsed.get("course"):
-                    note_parts.append(f"Course: {parsed['course']}")
-                if parsed.get("type"):
-                    note_parts.append(f"Type: {parsed['type']}")
-                if parsed.get("date"):
-                    note_parts.append(f"Date: {parsed['date']}")
-                if parsed.get("subject_hints"):
-                    subjects = ", ".join(parsed["subject_hints"][:2])
-                    note_parts.append(f"Subjects: {subjects}")
-            
-            if file_info.get("content", {}).get("summary"):
-                summary = file_info["content"]["summary"]
-                if len(summary) > 80:
-                    summary = summary[:77] + "..."
-                note_parts.append(summary)
-            elif file_info.get("content", {}).get("keywords"):
-                keywords = ", ".join(file_info["content"]["keywords"][:5])
-                note_parts.append(f"Keywords: {keywords}")
-            
-            if note_parts:
-                auto_note = " | ".join(note_parts)
-                memory.data["file_notes"][file_path_str] = auto_note
-                notes_generated += 1
-        except Exception:
-            continue
-    
-    # Save notes
-    memory.save()
-    progress.setValue(len(files_to_process))
-    
-    if notes_generated > 0:
-        QMessageBox.information(parent_widget, "Notes Generated", f"Generated notes for {notes_generated} file(s).")
-
+        if notes_generated:
+            QMessageBox.information(parent_widget, "Notes Generated", f"Generated notes for {notes_generated} file(s).")
+        if on_finished is not None:
+            on_finished()
+    
+    def on_thread_finished():
+        # QThread.finished: run() has returned and the thread has exited, so
+        # the worker can be released without destroying a running thread
+        parent_widget.note_worker = None
+        worker.deleteLater()
+    
+    worker.progress.connect(on_progress)
+    worker.notes_chunk.connect(save_notes)
+    worker.notes_done.connect(on_notes_done)
+    worker.finished.connect(on_thread_finished)
+    progress.canceled.connect(worker.cancel)
+    worker.start()
@@ -6,6 +6,16 @@ Helper functions for managing operation cards and displaying operation details.
 
 import time
 
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QColor, QTextCharFormat
+
+# Only the most recent operations are kept; older cards scroll out of the log
+MAX_OPERATIONS = 500
+# Each action card is one block in the log; leave room for status lines too
+LOG_MAX_BLOCKS = MAX_OPERATIONS * 2
+# Stats updates within this window are folded into one detail view refresh
+DETAILS_REFRESH_MS = 50
+
 
 def add_action_card(gui_instance, icon, title, subtitle, bg, action_type=None):
     """Add an action card to the operations log.
@@ -30,43 +40,40 @@ def add_action_card(gui_instance, icon, title, subtitle, bg, action_type=None):
     operation_id = gui_instance.operation_counter
     
     # Store operation info
+    timestamp = time.time()
     op_info = {
         "id": operation_id,
         "action": action_type or title,
         "path": subtitle,
         "icon": icon,
-        "timestamp": time.time(),
+        "timestamp": timestamp,
+        "timestamp_str": time.strftime('%H:%M:%S', time.localtime(timestamp)),
         "files_scanned": 0,
         "files_moved": 0,
         "duration": 0
     }
     gui_instance.operations.append(op_info)
+    gui_instance.operations_by_id[operation_id] = op_info
+    if len(gui_instance.operations) > MAX_OPERATIONS:
+        for old_op in gui_instance.operations[:-MAX_OPERATIONS]:
+            gui_instance.operations_by_id.pop(old_op["id"], None)
+        del gui_instance.operations[:-MAX_OPERATIONS]
     
-    # Make it clickable with anchor
-    html = f"""
-    <a href="op_{operation_id}" style="text-decoration:none; color:inherit; display:block;">
-    <div style="
-        background:{bg};
-        border-radius:0px;
-        margin:3px 0;
-        padding:10px 12px;
-        border-top: 2px inset {gui_instance.border_dark};
-        border-left: 2px inset {gui_instance.border_dark};
-        border-bottom: 2px inset {gui_instance.border_light};
-        border-right: 2px inset {gui_instance.border_light};
-        cursor:pointer;
-    " id="op_{operation_id}">
-        <div style="display:flex; align-items:center; gap:10px;">
-            <img src='icons/{icon}' width='24' height='24' style='flex-shrink:0; vertical-align:middle;'>
-            <div style="flex:1; min-width:0;">
-                <div style="color:{gui_instance.accent}; font-size:12px; font-weight:bold; font-family:'Courier New', 'Monaco', monospace; margin-bottom:2px;">{title}</div>
-                <div style="color:{gui_instance.text}; font-weight:normal; font-size:10px; font-family:'Courier New', 'Monaco', monospace; opacity:0.75; word-break:break-all;">{subtitle}</div>
-    </div>
-        </div>
-    </div>
-    </a>
-    """
-    gui_instance.log_box.append(html)
+    # Two-line card (title over subtitle) on the card color; every character
+    # carries the op_<id> link that on_operation_clicked resolves
+    href = f"op_{operation_id}"
+    background = QColor(bg)
+    title_fmt = QTextCharFormat(gui_instance._log_fmts["card_title"])
+    subtitle_fmt = QTextCharFormat(gui_instance._log_fmts["card_subtitle"])
+    for fmt in (title_fmt, subtitle_fmt):
+        fmt.setBackground(background)
+        fmt.setAnchorHref(href)
+    # U+2028 breaks the line but keeps the card one block (see LOG_MAX_BLOCKS)
+    gui_instance.log_box.append_fragments([
+        (f"\u00a0{title}\u00a0", title_fmt),
+        ("\u2028", title_fmt),
+        (f"\u00a0{subtitle}\u00a0", subtitle_fmt),
+    ])
     
     return operation_id
 
@@ -79,11 +86,7 @@ def show_operation_details(gui_instance, operation_id):
         operation_id: ID of the operation to show
     """
     # Find the operation
-    op = None
-    for operation in gui_instance.operations:
-        if operation["id"] == operation_id:
-            op = operation
-            break
+    op = gui_instance.operations_by_id.get(operation_id)
     
     if not op:
         gui_instance.operation_detail_label.setText("Operation not found")
@@ -104,7 +107,7 @@ def show_operation_details(gui_instance, operation_id):
 <p><b>Duration:</b> {duration:.1f}s</p>
 <p><b>Files Scanned:</b> {op['files_scanned']}</p>
 <p><b>Files Moved:</b> {op['files_moved']}</p>
-<p><b>Time:</b> {time.strftime('%H:%M:%S', time.localtime(op['timestamp']))}</p>
+<p><b>Time:</b> {op['timestamp_str']}</p>
 </div>
     """.strip()
     
@@ -122,12 +125,25 @@ def update_operation_stats(gui_instance, operation_id, files_scanned=0, files_mo
         files_scanned: Number of files scanned to add
         files_moved: Number of files moved to add
     """
-    for op in gui_instance.operations:
-        if op["id"] == operation_id:
-            op["files_scanned"] += files_scanned
-            op["files_moved"] += files_moved
-            # Refresh detail view if this operation is selected
-            if gui_instance.selected_operation_id == operation_id:
-                show_operation_details(gui_instance, operation_id)
-            break
+    op = gui_instance.operations_by_id.get(operation_id)
+    if op:
+        op["files_scanned"] += files_scanned
+        op["files_moved"] += files_moved
+        # Refresh detail view if this operation is selected
+        if gui_instance.selected_operation_id == operation_id:
+            _schedule_details_refresh(gui_instance, operation_id)
+
 
+def _schedule_details_refresh(gui_instance, operation_id):
+    """Coalesce rapid stats updates into a single detail view refresh."""
+    if gui_instance._details_refresh_pending:
+        return
+    gui_instance._details_refresh_pending = True
+    
+    def refresh():
+        gui_instance._details_refresh_pending = False
+        # Skip if the user picked another operation in the meantime
+        if gui_instance.selected_operation_id == operation_id:
+            show_operation_details(gui_instance, operation_id)
+    
+    QTimer.singleShot(DETAILS_REFRESH_MS, refresh)
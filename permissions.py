@@ -6,17 +6,33 @@ root directory. Includes the PermissionsStore class and PermissionsDialog.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-    QCheckBox, QLineEdit, QFileDialog, QMessageBox, QWidget, QComboBox
+    QCheckBox, QLineEdit, QFileDialog, QMessageBox, QWidget, QComboBox, QFormLayout
 )
 
 from config import CONFIG_DIR, CONFIG_PATH, DEFAULT_SORTME, ROOT, DEFAULT_AI_MODEL, POPULAR_MODELS
 
 
+# Sunken box showing the chosen root directory
+_CURRENT_DIR_QSS = """
+    QLabel {
+        background-color: #f0f0f0;
+        border: 1px inset #808080;
+        padding: 8px;
+        font-family: 'Courier New', 'Monaco', monospace;
+    }
+"""
+
+# Bold heading above each settings group
+_SECTION_LABEL_QSS = "font-weight: bold; font-family: 'Courier New', 'Monaco', monospace;"
+
+
 # PermissionsStore manages the sandbox system that restricts AI file operations
 # to a single user-approved root directory. This is a safety feature separate
 # from macOS privacy permissions - it ensures the AI can only access files
@@ -30,6 +46,12 @@ class PermissionsStore:
 
     def __init__(self) -> None:
         self.allowed_root: Optional[Path] = None
+        # abspath and realpath of allowed_root (each with a trailing-separator
+        # prefix), computed once per root change for is_allowed
+        self._allowed_root_resolved: Optional[str] = None
+        self._allowed_root_prefix: Optional[str] = None
+        self._allowed_root_real: Optional[str] = None
+        self._allowed_root_real_prefix: Optional[str] = None
         self.preview_mode: bool = False
         self.ai_model: str = DEFAULT_AI_MODEL
         self.load_or_init()
@@ -45,20 +67,20 @@ class PermissionsStore:
                 if "allowed_root" in data:
                     root_str = data.get("allowed_root")
                     if root_str and isinstance(root_str, str):
-                        self.allowed_root = Path(root_str).expanduser()
+                        self.set_allowed_root(Path(root_str).expanduser())
                 elif "allowed_roots" in data:
                     # Migrate from old format: use first root or SortMe
                     roots = data.get("allowed_roots", [])
                     if roots and isinstance(roots, list) and len(roots) > 0:
-                        self.allowed_root = Path(roots[0]).expanduser()
+                        self.set_allowed_root(Path(roots[0]).expanduser())
                     else:
-                        self.allowed_root = DEFAULT_SORTME if DEFAULT_SORTME.exists() else None
+                        self.set_allowed_root(DEFAULT_SORTME if DEFAULT_SORTME.exists() else None)
                 else:
-                    self.allowed_root = None
+                    self.set_allowed_root(None)
                 self.preview_mode = data.get("preview_mode", False)
                 self.ai_model = data.get("ai_model", DEFAULT_AI_MODEL)
             except Exception:
-                self.allowed_root = None
+                self.set_allowed_root(None)
                 self.preview_mode = False
                 self.ai_model = DEFAULT_AI_MODEL
         else:
@@ -66,9 +88,25 @@ class PermissionsStore:
             self.ai_model = DEFAULT_AI_MODEL
         if not self.allowed_root:
             # First run default: use SortMe if it exists
-            self.allowed_root = DEFAULT_SORTME if DEFAULT_SORTME.exists() else None
+            self.set_allowed_root(DEFAULT_SORTME if DEFAULT_SORTME.exists() else None)
             self.save()
 
+    def set_allowed_root(self, root: Optional[Path]) -> None:
+        """Set the sandbox root and cache its absolute and real forms for permission checks."""
+        self.allowed_root = root
+        if root:
+            resolved = os.path.abspath(os.path.expanduser(str(root)))
+            real = os.path.realpath(resolved)
+            self._allowed_root_resolved = resolved
+            self._allowed_root_prefix = resolved if resolved.endswith(os.sep) else resolved + os.sep
+            self._allowed_root_real = real
+            self._allowed_root_real_prefix = real if real.endswith(os.sep) else real + os.sep
+        else:
+            self._allowed_root_resolved = None
+            self._allowed_root_prefix = None
+            self._allowed_root_real = None
+            self._allowed_root_real_prefix = None
+
     def save(self) -> None:
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         payload = {
@@ -76,75 +114,51 @@ class PermissionsStore:
             "preview_mode": getattr(self, "preview_mode", False),
             "ai_model": getattr(self, "ai_model", DEFAULT_AI_MODEL)
         }
-        CONFIG_PATH.write_text(json.dumps(payload, indent=2))
+        # Write to a temp file and swap it in so a crash mid-write can't
+        # leave a truncated config.json behind
+        tmp_path = str(CONFIG_PATH) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, CONFIG_PATH)
 
     def _expand_macros(self, p: str) -> str:
         # Support your prompt's {ROOT} macro + standard ~
-        return p.replace("{ROOT}", ROOT)
+        # Skip the replace (and its new string) when there's no macro
+        return p.replace("{ROOT}", ROOT) if "{ROOT}" in p else p
 
-    def normalize(self, path_str: str) -> Optional[Path]:
-        if not isinstance(path_str, str) or not path_str.strip():
+    def normalize(self, path_str: str) -> Optional[str]:
+        if not isinstance(path_str, str):
             return None
-        try:
-            expanded = self._expand_macros(path_str.strip())
-            p = Path(expanded).expanduser()
-            # For existing paths, resolve them. For non-existent paths (like new folders),
-            # resolve the parent and then append the name
-            if p.exists():
-                return p.resolve()
-            else:
-                # Path doesn't exist yet - resolve parent if it exists, then append name
-                parent = p.parent
-                if parent.exists():
-                    resolved_parent = parent.resolve()
-                    return resolved_parent / p.name
-                else:
-                    # Try to resolve what we can
-                    try:
-                        return p.resolve()
-                    except:
-                        # If resolve fails, return the path as-is (absolute if possible)
-                        return p.absolute() if p.is_absolute() else p
-        except Exception:
+        s = path_str.strip()
+        if not s:
             return None
+        s = self._expand_macros(s)
+        # Only pay for home expansion when the path actually uses it
+        if s.startswith("~"):
+            s = os.path.expanduser(s)
+        # abspath is purely lexical (collapses "..", no stat calls), so new
+        # paths such as folders about to be created normalize the same way
+        return os.path.abspath(s)
 
-    def is_allowed(self, path: Path) -> bool:
+    def is_allowed(self, path: Union[str, Path]) -> bool:
         """Check if a path is within the allowed root directory."""
-        if not self.allowed_root:
+        root = self._allowed_root_resolved
+        if not root:
             return False
         try:
-            root = self.allowed_root.expanduser().resolve()
-            # For non-existent paths, check if parent is within allowed root
-            path = path.expanduser()
-            # then the path itself will be allowed
-            if not path.exists():
-                parent = path.parent
-                if parent.exists():
-                    parent = parent.resolve()
-                    try:
-                        parent.relative_to(root)
-                        # Parent is within root, so path will be allowed
-                        return True
-                    except ValueError:
-                        return False
-                # If parent doesn't exist, try to resolve path parts
-                try:
-                    path = path.resolve()
-                except:
-                    # Can't resolve, try absolute
-                    path = path.absolute()
-            else:
-                path = path.resolve()
-            
-            # Check if path is the same as root, or if path is within root
-            if path == root:
-                return True
-            # Check if path is a subdirectory of root
-            try:
-                path.relative_to(root)
-                return True
-            except ValueError:
+            abs_path = os.path.abspath(os.path.expanduser(str(path)))
+            real_root = self._allowed_root_real
+            # Cheap lexical reject: not the root or inside it, as written or via
+            # the root's real location (prefixes end with a separator so
+            # "/root10" doesn't match a "/root1" sandbox)
+            if not (abs_path == root or abs_path.startswith(self._allowed_root_prefix)
+                    or abs_path == real_root or abs_path.startswith(self._allowed_root_real_prefix)):
                 return False
+            # Follow symlinks before allowing, so a link inside the root can't
+            # reach outside it; realpath resolves the existing part of paths
+            # that don't exist yet (e.g. a folder about to be created)
+            real_path = os.path.realpath(abs_path)
+            return real_path == real_root or real_path.startswith(self._allowed_root_real_prefix)
         except Exception:
             return False
 
@@ -157,7 +171,7 @@ class PermissionsStore:
                 "Blocked: that path is outside the folders you've granted access to. "
                 "Open Permissions (⚙) and enable the folder first."
             )
-        return True, str(p)
+        return True, p
 
 
 # PermissionsDialog is the settings window where users configure:
@@ -165,6 +179,15 @@ class PermissionsStore:
 # - Preview mode (show actions before executing)
 # - Content reading settings (which file types to analyze)
 class PermissionsDialog(QDialog):
+    # (content type key, checkbox attribute) for each file type toggle
+    _TYPE_CHECKBOXES = (
+        ("text", "content_reading_text"),
+        ("pdf", "content_reading_pdf"),
+        ("office", "content_reading_office"),
+        ("images", "content_reading_images"),
+        ("archives", "content_reading_archives"),
+    )
+
     def __init__(self, store: PermissionsStore, parent=None) -> None:
         super().__init__(parent)
         self.store = store
@@ -180,14 +203,7 @@ class PermissionsDialog(QDialog):
         # Current directory display
         self.current_dir_label = QLabel("No directory selected")
         self.current_dir_label.setWordWrap(True)
-        self.current_dir_label.setStyleSheet("""
-            QLabel {
-                background-color: #f0f0f0;
-                border: 1px inset #808080;
-                padding: 8px;
-                font-family: 'Courier New', 'Monaco', monospace;
-            }
-        """)
+        self.current_dir_label.setStyleSheet(_CURRENT_DIR_QSS)
         layout.addWidget(self.current_dir_label)
 
         # Select directory button
@@ -201,10 +217,52 @@ class PermissionsDialog(QDialog):
         self.cb_preview_mode.setToolTip("When enabled, you'll see a preview of all file operations before they're executed")
         layout.addWidget(self.cb_preview_mode)
 
-        # Content Reading Settings
+        # Content Reading Settings (filled in on the first event-loop pass
+        # so the rest of the dialog can paint first)
+        self._content_reading_layout = QVBoxLayout()
+        self._content_reading_layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(self._content_reading_layout)
+        self._content_reading_built = False
+        QTimer.singleShot(0, self._build_content_reading_section)
+
+        # AI Model Selection
+        layout.addWidget(QLabel(""))  # Spacer
+        ai_model_label = QLabel("AI Model:")
+        ai_model_label.setStyleSheet(_SECTION_LABEL_QSS)
+        self.ai_model_combo = QComboBox()
+        self.ai_model_combo.setEditable(True)  # Allow custom model names
+        self.ai_model_combo.addItems(POPULAR_MODELS)
+        self.ai_model_combo.setToolTip("Select an AI model. You can also type a custom model name.")
+        model_form = QFormLayout()
+        model_form.addRow(ai_model_label, self.ai_model_combo)
+        layout.addLayout(model_form)
+
+        # Buttons
+        buttons_row = QHBoxLayout()
+        self.save_btn = QPushButton("Save")
+        self.close_btn = QPushButton("Close")
+        buttons_row.addStretch()
+        buttons_row.addWidget(self.save_btn)
+        buttons_row.addWidget(self.close_btn)
+        layout.addLayout(buttons_row)
+
+        self.setLayout(layout)
+
+        self.save_btn.clicked.connect(self.save)
+        self.close_btn.clicked.connect(self.close)
+
+        self._sync_from_store()
+
+    def _build_content_reading_section(self) -> None:
+        """Create the content reading widgets and load their values."""
+        if self._content_reading_built:
+            return
+        self._content_reading_built = True
+        layout = self._content_reading_layout
+        
         layout.addWidget(QLabel(""))  # Spacer
         content_reading_label = QLabel("Content Reading Settings:")
-        content_reading_label.setStyleSheet("font-weight: bold; font-family: 'Courier New', 'Monaco', monospace;")
+        content_reading_label.setStyleSheet(_SECTION_LABEL_QSS)
         layout.addWidget(content_reading_label)
         
         # Master toggle
@@ -236,52 +294,15 @@ class PermissionsDialog(QDialog):
         layout.addWidget(file_types_widget)
         
         # Max file size setting
-        max_size_layout = QHBoxLayout()
-        max_size_layout.setContentsMargins(20, 0, 0, 0)
-        max_size_label = QLabel("Max file size (MB):")
-        max_size_layout.addWidget(max_size_label)
+        max_size_form = QFormLayout()
+        max_size_form.setContentsMargins(20, 0, 0, 0)
         self.content_reading_max_size = QLineEdit()
         self.content_reading_max_size.setPlaceholderText("5")
         self.content_reading_max_size.setMaximumWidth(60)
-        max_size_layout.addWidget(self.content_reading_max_size)
-        max_size_layout.addStretch()
-        max_size_widget = QWidget()
-        max_size_widget.setLayout(max_size_layout)
-        layout.addWidget(max_size_widget)
-
-        # AI Model Selection
-        layout.addWidget(QLabel(""))  # Spacer
-        ai_model_label = QLabel("AI Model:")
-        ai_model_label.setStyleSheet("font-weight: bold; font-family: 'Courier New', 'Monaco', monospace;")
-        layout.addWidget(ai_model_label)
+        max_size_form.addRow("Max file size (MB):", self.content_reading_max_size)
+        layout.addLayout(max_size_form)
         
-        model_layout = QHBoxLayout()
-        model_layout.setContentsMargins(0, 0, 0, 0)
-        self.ai_model_combo = QComboBox()
-        self.ai_model_combo.setEditable(True)  # Allow custom model names
-        self.ai_model_combo.addItems(POPULAR_MODELS)
-        self.ai_model_combo.setToolTip("Select an AI model. You can also type a custom model name.")
-        model_layout.addWidget(self.ai_model_combo)
-        model_layout.addStretch()
-        model_widget = QWidget()
-        model_widget.setLayout(model_layout)
-        layout.addWidget(model_widget)
-
-        # Buttons
-        buttons_row = QHBoxLayout()
-        self.save_btn = QPushButton("Save")
-        self.close_btn = QPushButton("Close")
-        buttons_row.addStretch()
-        buttons_row.addWidget(self.save_btn)
-        buttons_row.addWidget(self.close_btn)
-        layout.addLayout(buttons_row)
-
-        self.setLayout(layout)
-
-        self.save_btn.clicked.connect(self.save)
-        self.close_btn.clicked.connect(self.close)
-
-        self._sync_from_store()
+        self._sync_content_reading()
 
     def _sync_from_store(self) -> None:
         # Display current root directory
@@ -293,33 +314,30 @@ class PermissionsDialog(QDialog):
         # Sync preview mode
         self.cb_preview_mode.setChecked(getattr(self.store, "preview_mode", False))
         
-        # Sync content reading config from parent window's memory
+        self._sync_content_reading()
+        
+        # Sync AI model
+        current_model = getattr(self.store, "ai_model", DEFAULT_AI_MODEL)
+        self.ai_model_combo.setCurrentText(current_model)
+
+    def _sync_content_reading(self) -> None:
+        """Load content reading config from the parent window's memory into the widgets."""
+        if not self._content_reading_built:
+            return
         parent_window = self.parent()
         if parent_window and hasattr(parent_window, 'memory'):
-            config = parent_window.memory.data.get("content_reading_config", {})
-            default_config = {
-                "enabled": False,
-                "enabled_types": ["text"],
-                "max_file_size": 5 * 1024 * 1024
-            }
-            for key, value in default_config.items():
-                if key not in config:
-                    config[key] = value
+            config = parent_window.memory.data.setdefault("content_reading_config", {})
+            config.setdefault("enabled", False)
+            config.setdefault("enabled_types", ["text"])
+            config.setdefault("max_file_size", 5 * 1024 * 1024)
             
-            self.content_reading_enabled.setChecked(config.get("enabled", False))
-            enabled_types = config.get("enabled_types", [])
-            self.content_reading_text.setChecked("text" in enabled_types)
-            self.content_reading_pdf.setChecked("pdf" in enabled_types)
-            self.content_reading_office.setChecked("office" in enabled_types)
-            self.content_reading_images.setChecked("images" in enabled_types)
-            self.content_reading_archives.setChecked("archives" in enabled_types)
+            self.content_reading_enabled.setChecked(config["enabled"])
+            enabled_types = set(config["enabled_types"])
+            for content_type, attr in self._TYPE_CHECKBOXES:
+                getattr(self, attr).setChecked(content_type in enabled_types)
             
-            max_size_mb = config.get("max_file_size", 5 * 1024 * 1024) / (1024 * 1024)
+            max_size_mb = config["max_file_size"] / (1024 * 1024)
             self.content_reading_max_size.setText(str(int(max_size_mb)))
-        
-        # Sync AI model
-        current_model = getattr(self.store, "ai_model", DEFAULT_AI_MODEL)
-        self.ai_model_combo.setCurrentText(current_model)
 
     def select_folder(self) -> None:
         folder = QFileDialog.getExistingDirectory(self, "Choose root directory for file sorting")
@@ -328,7 +346,7 @@ class PermissionsDialog(QDialog):
 
         chosen = Path(folder).expanduser().resolve()
         if chosen.exists() and chosen.is_dir():
-            self.store.allowed_root = chosen
+            self.store.set_allowed_root(chosen)
             self.current_dir_label.setText(str(chosen))
 
     def save(self) -> None:
@@ -343,25 +361,18 @@ class PermissionsDialog(QDialog):
         self.store.save()
         
         # Save content reading config to parent window's memory
+        self._build_content_reading_section()
         parent_window = self.parent()
         if parent_window and hasattr(parent_window, 'memory'):
             config = {
                 "enabled": self.content_reading_enabled.isChecked(),
-                "enabled_types": [],
+                "enabled_types": [
+                    content_type for content_type, attr in self._TYPE_CHECKBOXES
+                    if getattr(self, attr).isChecked()
+                ],
                 "max_file_size": 5 * 1024 * 1024
             }
             
-            if self.content_reading_text.isChecked():
-                config["enabled_types"].append("text")
-            if self.content_reading_pdf.isChecked():
-                config["enabled_types"].append("pdf")
-            if self.content_reading_office.isChecked():
-                config["enabled_types"].append("office")
-            if self.content_reading_images.isChecked():
-                config["enabled_types"].append("images")
-            if self.content_reading_archives.isChecked():
-                config["enabled_types"].append("archives")
-            
             try:
                 max_size_mb = float(self.content_reading_max_size.text() or "5")
                 config["max_file_size"] = int(max_size_mb * 1024 * 1024)
@@ -18,11 +18,114 @@ from config import DEFAULT_AI_MODEL, POPULAR_MODELS, DEFAULT_SORTME
 from permissions import PermissionsStore
 
 
+# Windows 95 retro theme for the whole dialog
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #c0c0c0;
+        font-family: 'Courier New', 'Monaco', monospace;
+    }
+    QLabel {
+        color: #000000;
+        font-size: 11px;
+    }
+    QPushButton {
+        background-color: #c0c0c0;
+        border: 2px outset #c0c0c0;
+        padding: 4px 12px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #d0d0d0;
+    }
+    QPushButton:pressed {
+        border: 2px inset #c0c0c0;
+    }
+    QComboBox {
+        background-color: #ffffff;
+        border: 1px inset #808080;
+        padding: 4px;
+        min-width: 200px;
+        color: #000000;
+    }
+    QComboBox:focus {
+        border: 2px solid #0000ff;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #ffffff;
+        color: #000000;
+        selection-background-color: #0080ff;
+        selection-color: #ffffff;
+    }
+"""
+
+# Sunken box showing the chosen root directory
+_CURRENT_DIR_QSS = """
+    QLabel {
+        background-color: #ffffff;
+        border: 1px inset #808080;
+        padding: 8px;
+        min-height: 30px;
+    }
+"""
+
+# Prominent blue "Select Directory" button
+_SELECT_DIR_BTN_QSS = """
+    QPushButton {
+        background-color: #0080ff;
+        color: #ffffff;
+        font-weight: bold;
+        border: 2px outset #0080ff;
+        padding: 6px 16px;
+        min-width: 150px;
+    }
+    QPushButton:hover {
+        background-color: #0090ff;
+        border: 2px outset #0090ff;
+    }
+    QPushButton:pressed {
+        background-color: #0070ee;
+        border: 2px inset #0070ee;
+    }
+"""
+
+# Keep model combo text black
+_COMBO_QSS = """
+    QComboBox {
+        color: #000000;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+"""
+
+# Blue "Start" button
+_START_BTN_QSS = """
+    QPushButton {
+        background-color: #0080ff;
+        color: #ffffff;
+        font-weight: bold;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #0090ff;
+    }
+"""
+
+
+# Model names from the last successful 'ollama list' (None until it succeeds)
+_installed_models_cache = None
+
+
 def get_installed_ollama_models():
     """
     Get list of installed Ollama models by running 'ollama list'.
-    Returns list of model names, or empty list if command fails.
+    Returns list of model names, or POPULAR_MODELS if the command fails.
+    A successful result is cached so later dialogs don't spawn ollama again.
     """
+    global _installed_models_cache
+    if _installed_models_cache is not None:
+        return list(_installed_models_cache)
     try:
         result = subprocess.run(
             ['ollama', 'list'],
@@ -31,16 +134,19 @@ def get_installed_ollama_models():
             timeout=5
         )
         if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
             models = []
+            seen = set()
             # Skip header line (usually "NAME            ID              SIZE    MODIFIED")
-            for line in lines[1:]:
-                if line.strip():
-                    # Extract model name (first column)
-                    model_name = line.split()[0]
-                    if model_name and model_name not in models:
-                        models.append(model_name)
-            return models if models else POPULAR_MODELS  # Fallback to popular models if empty
+            for line in result.stdout.splitlines()[1:]:
+                # Model name is the first column; blank lines split to []
+                parts = line.split(None, 1)
+                if parts and parts[0] not in seen:
+                    seen.add(parts[0])
+                    models.append(parts[0])
+            if not models:
+                return POPULAR_MODELS  # Fallback to popular models if empty
+            _installed_models_cache = tuple(models)
+            return models
         else:
             return POPULAR_MODELS  # Fallback if command fails
     except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
@@ -59,45 +165,7 @@ class StartupDialog(QDialog):
         self.setMinimumHeight(300)
         
         # Apply Windows 95 retro theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #c0c0c0;
-                font-family: 'Courier New', 'Monaco', monospace;
-            }
-            QLabel {
-                color: #000000;
-                font-size: 11px;
-            }
-            QPushButton {
-                background-color: #c0c0c0;
-                border: 2px outset #c0c0c0;
-                padding: 4px 12px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-            QPushButton:pressed {
-                border: 2px inset #c0c0c0;
-            }
-            QComboBox {
-                background-color: #ffffff;
-                border: 1px inset #808080;
-                padding: 4px;
-                min-width: 200px;
-                color: #000000;
-            }
-            QComboBox:focus {
-                border: 2px solid #0000ff;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                color: #000000;
-                selection-background-color: #0080ff;
-                selection-color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         layout = QVBoxLayout()
         layout.setSpacing(15)
@@ -123,14 +191,7 @@ class StartupDialog(QDialog):
         # Current directory display
         self.current_dir_label = QLabel("No directory selected")
         self.current_dir_label.setWordWrap(True)
-        self.current_dir_label.setStyleSheet("""
-            QLabel {
-                background-color: #ffffff;
-                border: 1px inset #808080;
-                padding: 8px;
-                min-height: 30px;
-            }
-        """)
+        self.current_dir_label.setStyleSheet(_CURRENT_DIR_QSS)
         layout.addWidget(self.current_dir_label)
         
         # Select directory button
@@ -138,24 +199,7 @@ class StartupDialog(QDialog):
         self.select_dir_btn = QPushButton("Select Directory…")
         self.select_dir_btn.clicked.connect(self.select_folder)
         # Make button more prominent and distinguishable
-        self.select_dir_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0080ff;
-                color: #ffffff;
-                font-weight: bold;
-                border: 2px outset #0080ff;
-                padding: 6px 16px;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #0090ff;
-                border: 2px outset #0090ff;
-            }
-            QPushButton:pressed {
-                background-color: #0070ee;
-                border: 2px inset #0070ee;
-            }
-        """)
+        self.select_dir_btn.setStyleSheet(_SELECT_DIR_BTN_QSS)
         dir_btn_layout.addWidget(self.select_dir_btn)
         dir_btn_layout.addStretch()
         layout.addLayout(dir_btn_layout)
@@ -181,14 +225,7 @@ class StartupDialog(QDialog):
         self.ai_model_combo.setToolTip("Select an AI model from your installed Ollama models.")
         
         # Ensure text color is black
-        self.ai_model_combo.setStyleSheet("""
-            QComboBox {
-                color: #000000;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-        """)
+        self.ai_model_combo.setStyleSheet(_COMBO_QSS)
         model_layout.addWidget(self.ai_model_combo)
         model_layout.addStretch()
         layout.addLayout(model_layout)
@@ -199,17 +236,7 @@ class StartupDialog(QDialog):
         buttons_row = QHBoxLayout()
         self.start_btn = QPushButton("Start")
         self.start_btn.setDefault(True)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0080ff;
-                color: #ffffff;
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #0090ff;
-            }
-        """)
+        self.start_btn.setStyleSheet(_START_BTN_QSS)
         self.cancel_btn = QPushButton("Cancel")
         buttons_row.addStretch()
         buttons_row.addWidget(self.cancel_btn)
@@ -232,7 +259,7 @@ class StartupDialog(QDialog):
         else:
             # Try to use default
             if DEFAULT_SORTME.exists():
-                self.store.allowed_root = DEFAULT_SORTME
+                self.store.set_allowed_root(DEFAULT_SORTME)
                 self.current_dir_label.setText(str(DEFAULT_SORTME))
             else:
                 self.current_dir_label.setText("No directory selected")
@@ -249,7 +276,7 @@ class StartupDialog(QDialog):
         
         chosen = Path(folder).expanduser().resolve()
         if chosen.exists() and chosen.is_dir():
-            self.store.allowed_root = chosen
+            self.store.set_allowed_root(chosen)
             self.current_dir_label.setText(str(chosen))
     
     def accept(self):
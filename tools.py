@@ -1,20 +1,28 @@
+import mmap
 import os
 import shutil
-from pathlib import Path
+from itertools import islice
+
+# Largest file read_file will load (matches the content reading default)
+READ_FILE_MAX_BYTES = 5 * 1024 * 1024
+
+# Text formats read_file is allowed to open
+_ALLOWED_READ_SUFFIXES = frozenset({".txt", ".md", ".py", ".java", ".json", ".csv", ".log", ".xml", ".html"})
 
 def list_files(path, limit=None):
     try:
-        items = os.listdir(path)
+        # scandir builds each entry's full path itself; islice stops reading
+        # the directory once the AI's limit is reached
+        with os.scandir(path) as it:
+            if limit is None or limit >= 0:
+                full_paths = [entry.path for entry in islice(it, limit)]
+            else:
+                # islice rejects negative counts; keep the old slice
+                # semantics (all but the last -limit entries)
+                full_paths = [entry.path for entry in it][:limit]
     except Exception as e:
         return {"error": str(e)}
 
-    # Convert to absolute paths
-    full_paths = [os.path.join(path, i) for i in items]
-
-    # If AI only wants top N files
-    if limit is not None:
-        full_paths = full_paths[:limit]
-
     return {
         "count": len(full_paths),
         "message": f"Found {len(full_paths)} items.",
@@ -23,54 +31,71 @@ def list_files(path, limit=None):
 
 
 def move_file(src, dst):
-    src = Path(src)
-    dst = Path(dst)
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(src), str(dst))
-    return {"status": f"Moved {src.name} → {dst}"}
+    parent = os.path.dirname(dst)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    shutil.move(src, dst)
+    return {"status": f"Moved {os.path.basename(src)} → {dst}"}
 
 def file_type(path):
-    return {"type": Path(path).suffix}
+    return {"type": os.path.splitext(path)[1]}
 
 def create_folder(path):
     """Create a folder at the given path. Returns success status and message."""
     try:
-        # Convert to absolute path for consistent checking
-        folder_path = Path(path).expanduser()
-        # Get absolute path (works even if path doesn't exist yet)
-        abs_path = folder_path.absolute()
+        # Absolute path for consistent checking (works even if path doesn't exist yet)
+        abs_path = os.path.abspath(os.path.expanduser(path))
         
         # Check if it already exists (as directory)
-        if abs_path.exists():
-            if abs_path.is_dir():
-                return {"status": f"Folder already exists: {path}", "already_exists": True, "path": str(abs_path)}
+        if os.path.exists(abs_path):
+            if os.path.isdir(abs_path):
+                return {"status": f"Folder already exists: {path}", "already_exists": True, "path": abs_path}
             else:
                 return {"error": f"Path exists but is not a directory: {path}"}
         
-        # Create the folder (parents=True creates parent directories if needed)
-        abs_path.mkdir(parents=True, exist_ok=False)
+        # Create the folder (makedirs creates parent directories if needed)
+        os.makedirs(abs_path)
         
         # Verify it was actually created
-        if abs_path.exists() and abs_path.is_dir():
-            return {"status": f"Created folder: {path}", "path": str(abs_path)}
+        if os.path.isdir(abs_path):
+            return {"status": f"Created folder: {path}", "path": abs_path}
         else:
             return {"error": f"Folder creation failed: {path}"}
     except FileExistsError:
         # Handle race condition where folder was created between check and creation
-        abs_path = Path(path).expanduser().absolute()
-        if abs_path.exists() and abs_path.is_dir():
-            return {"status": f"Folder already exists: {path}", "already_exists": True, "path": str(abs_path)}
+        abs_path = os.path.abspath(os.path.expanduser(path))
+        if os.path.isdir(abs_path):
+            return {"status": f"Folder already exists: {path}", "already_exists": True, "path": abs_path}
         return {"error": f"Folder creation failed: {path}"}
     except PermissionError as e:
         return {"error": f"Permission denied: Cannot create folder at {path}"}
     except Exception as e:
         return {"error": f"Error creating folder: {str(e)}"}
 
+def _count_files(path):
+    """
+    Count non-directory entries under path, like summing len(files) over os.walk.
+    
+    Symlinks to folders are neither counted nor followed (os.walk lists them
+    in dirs, not files); symlinks to files are counted.
+    """
+    count = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if not entry.is_dir():
+                count += 1
+            elif not entry.is_symlink():
+                # Unreadable subfolders are skipped, as os.walk does
+                try:
+                    count += _count_files(entry.path)
+                except OSError:
+                    pass
+    return count
+
+
 def list_all_files(path):
     try:
-        count = 0
-        for root, dirs, files in os.walk(path):
-            count += len(files)
+        count = _count_files(path)
 
         return {
             "count": count,
@@ -83,16 +108,29 @@ def list_all_files(path):
 
 
 def read_file(path):
-    path = Path(path)
-    if not path.exists():
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
         return {"error": f"File not found: {path}"}
+    except OSError as e:
+        return {"error": f"Error reading file: {e}"}
 
     # Only allow safe text formats
-    allowed = [".txt", ".md", ".py", ".java", ".json", ".csv", ".log", ".xml", ".html"]
-    if path.suffix.lower() not in allowed:
-        return {"error": f"Cannot read file type: {path.suffix}"}
+    suffix = os.path.splitext(path)[1]
+    if suffix.lower() not in _ALLOWED_READ_SUFFIXES:
+        return {"error": f"Cannot read file type: {suffix}"}
+
+    if size > READ_FILE_MAX_BYTES:
+        return {"error": f"File too large to read ({size // (1024 * 1024)} MB); limit is {READ_FILE_MAX_BYTES // (1024 * 1024)} MB"}
 
     try:
-        return {"content": path.read_text(), "message": f"Read {path.name}"}
+        if size == 0:
+            content = ""
+        else:
+            # Map the file and decode straight from the mapping instead of
+            # reading it into a separate buffer first
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, "utf-8", "replace")
+        return {"content": content, "message": f"Read {os.path.basename(path)}"}
     except Exception as e:
         return {"error": f"Error reading file: {e}"}
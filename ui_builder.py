@@ -5,14 +5,33 @@ Functions for building the main GUI components. This module contains all the
 UI creation logic to keep the main FileAdvisorGUI class focused on logic.
 """
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QTextOption
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QColor, QFont, QTextCharFormat, QTextFormat, QTextOption
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QTextBrowser,
-    QLineEdit, QPushButton, QSplitter, QStackedWidget, QListWidget
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextBrowser,
+    QLineEdit, QPushButton, QToolButton, QSplitter, QStackedWidget, QListView,
+    QSizePolicy
 )
 
-from ui_components import CustomTitleBar
+from ui_components import CustomTitleBar, ChatView, OperationLog
+from list_models import CategoriesModel, NotesModel
+from operation_utils import LOG_MAX_BLOCKS
+from ui_theme import MONO_FAMILIES, build_global_qss, mono_font
+
+# Oldest conversation lines are dropped past this many
+CHAT_MAX_BLOCKS = 2000
+
+
+def _palette(gui_instance) -> tuple:
+    """gui_instance's theme colors, in the order build_global_qss expects."""
+    return (
+        gui_instance.bg,
+        gui_instance.panel,
+        gui_instance.text,
+        gui_instance.border_dark,
+        gui_instance.border_light,
+        gui_instance.button_bg,
+    )
 
 
 def build_main_ui(gui_instance):
@@ -22,6 +41,9 @@ def build_main_ui(gui_instance):
         gui_instance: The FileAdvisorGUI instance to attach UI elements to
     """
     central = QWidget()
+    # Hold repaints until the whole tree and stylesheet are in place, so a
+    # rebuild on a visible window paints once instead of per added widget
+    central.setUpdatesEnabled(False)
     gui_instance.setCentralWidget(central)
     
     # CHAT WINDOW (LEFT) - with title bar
@@ -30,12 +52,6 @@ def build_main_ui(gui_instance):
     # FILE TRACKER LOG (RIGHT) - with title bar
     log_container = _build_log_panel(gui_instance)
     
-    # Splitter
-    gui_instance.splitter = QSplitter(Qt.Orientation.Horizontal)
-    gui_instance.splitter.addWidget(chat_container)
-    gui_instance.splitter.addWidget(log_container)
-    gui_instance.splitter.setSizes([700, 400])
-    
     # INPUT
     _build_input_row(gui_instance)
     
@@ -46,27 +62,33 @@ def build_main_ui(gui_instance):
     
     # Create stacked widget to combine operations list and detail view
     gui_instance.operations_stack = QStackedWidget()
-    detail_page = _build_detail_page(gui_instance)
     gui_instance.operations_stack.addWidget(log_container)  # Page 0: operations list
-    gui_instance.operations_stack.addWidget(detail_page)    # Page 1: detail view
+    # Page 1 (detail view) is built the first time an operation is opened
+    gui_instance._detail_page = None
     
     # PREFERENCES PANEL (above operations)
     prefs_panel = gui_instance._create_preferences_panel()
     
-    # RIGHT PANEL → vertical stack of preferences + operations (with stack) + counters
-    right_vertical_splitter = QSplitter(Qt.Orientation.Vertical)
-    right_vertical_splitter.addWidget(prefs_panel)  # top: preferences
-    right_vertical_splitter.addWidget(gui_instance.operations_stack)  # middle: operations list or detail view
+    # RIGHT PANEL → vertical stack of preferences + operations (with stack) + counters.
+    # A plain layout rather than a splitter: the preferences panel has a fixed
+    # height and the counters strip its natural one, so drag handles had
+    # nothing to resize.
+    right_panel = QWidget()
+    right_layout = QVBoxLayout()
+    right_layout.setContentsMargins(0, 0, 0, 0)
+    right_layout.setSpacing(4)
+    right_layout.addWidget(prefs_panel)  # top: preferences
+    right_layout.addWidget(gui_instance.operations_stack, 1)  # middle: operations list or detail view, takes spare height
     
     # Create counters widget container
     counters_widget = _build_counters_widget(gui_instance)
-    right_vertical_splitter.addWidget(counters_widget)
-    right_vertical_splitter.setSizes([250, 300, 50])  # preferences (bigger), operations stack (smaller), counters
+    right_layout.addWidget(counters_widget)
+    right_panel.setLayout(right_layout)
     
     # TOP HALF → Conversation (left) | Right panel (right)
     top_horizontal_splitter = QSplitter(Qt.Orientation.Horizontal)
     top_horizontal_splitter.addWidget(chat_container)
-    top_horizontal_splitter.addWidget(right_vertical_splitter)
+    top_horizontal_splitter.addWidget(right_panel)
     top_horizontal_splitter.setSizes([700, 400])
     
     # MAIN LAYOUT (Vertical)
@@ -90,18 +112,13 @@ def build_main_ui(gui_instance):
     
     central.setLayout(main_layout)
     
-    # Set main window background and border
-    gui_instance.setStyleSheet(f"""
-        QMainWindow {{
-            background-color: {gui_instance.bg};
-            border: 2px solid {gui_instance.border_dark};
-        }}
-        QLabel {{
-            color: {gui_instance.text};
-            font-family: 'Courier New', 'Monaco', monospace;
-            font-size: 11px;
-        }}
-    """)
+    # One font and one stylesheet for the whole window; children inherit the
+    # font, and widgets are matched by objectName
+    gui_instance.setFont(mono_font())
+    gui_instance.setStyleSheet(build_global_qss(_palette(gui_instance)))
+    
+    central.setUpdatesEnabled(True)
+    central.updateGeometry()
 
 
 def _build_chat_panel(gui_instance) -> QWidget:
@@ -114,38 +131,11 @@ def _build_chat_panel(gui_instance) -> QWidget:
     # Chat title bar
     chat_title = QLabel("  CONVERSATION")
     chat_title.setFixedHeight(24)
-    chat_title.setStyleSheet(f"""
-        QLabel {{
-            background-color: {gui_instance.button_bg};
-            color: {gui_instance.text};
-            font-family: 'Courier New', 'Monaco', monospace;
-            font-size: 11px;
-            font-weight: bold;
-            padding-left: 8px;
-            border-top: 2px inset {gui_instance.border_dark};
-            border-left: 2px inset {gui_instance.border_dark};
-            border-bottom: 1px solid {gui_instance.border_dark};
-        }}
-    """)
+    chat_title.setObjectName("chatTitle")
     chat_layout.addWidget(chat_title)
     
-    gui_instance.chat_box = QTextEdit()
-    gui_instance.chat_box.setReadOnly(True)
-    gui_instance.chat_box.setStyleSheet(f"""
-        QTextEdit {{
-            background-color: {gui_instance.panel};
-            color: {gui_instance.text};
-            border-top: none;
-            border-left: 2px solid {gui_instance.border_dark};
-            border-bottom: 2px solid {gui_instance.border_light};
-            border-right: 2px solid {gui_instance.border_light};
-            border-radius: 0px;
-            padding: 12px;
-            font-family: 'Courier New', 'Monaco', monospace;
-            font-size: 11px;
-            font-weight: bold;
-        }}
-    """)
+    gui_instance.chat_box = ChatView(CHAT_MAX_BLOCKS)
+    gui_instance.chat_box.setObjectName("chatBox")
     chat_layout.addWidget(gui_instance.chat_box)
     chat_container.setLayout(chat_layout)
     return chat_container
@@ -161,137 +151,77 @@ def _build_log_panel(gui_instance) -> QWidget:
     # Log title bar
     log_title = QLabel("  FILE OPERATIONS")
     log_title.setFixedHeight(24)
-    log_title.setStyleSheet(f"""
-        QLabel {{
-            background-color: {gui_instance.button_bg};
-            color: {gui_instance.text};
-            font-family: 'Courier New', 'Monaco', monospace;
-            font-size: 11px;
-            font-weight: bold;
-            padding-left: 8px;
-            border-top: 2px inset {gui_instance.border_dark};
-            border-left: 2px inset {gui_instance.border_dark};
-            border-bottom: 1px solid {gui_instance.border_dark};
-        }}
-    """)
+    log_title.setObjectName("logTitle")
     log_layout.addWidget(log_title)
     
-    gui_instance.log_box = QTextBrowser()
-    gui_instance.log_box.setOpenExternalLinks(False)
-    gui_instance.log_box.setStyleSheet(f"""
-        QTextBrowser {{
-            background-color: {gui_instance.panel};
-            color: {gui_instance.text};
-            border-top: none;
-            border-left: 2px solid {gui_instance.border_dark};
-            border-bottom: 2px solid {gui_instance.border_light};
-            border-right: 2px solid {gui_instance.border_light};
-            border-radius: 0px;
-            padding: 10px;
-            font-family: 'Courier New', 'Monaco', monospace;
-            font-size: 10px;
-            font-weight: bold;
-        }}
-    """)
+    gui_instance.log_box = OperationLog(LOG_MAX_BLOCKS)
+    gui_instance.log_box.setObjectName("logBox")
+    gui_instance._log_fmts = _build_log_formats(gui_instance)
     gui_instance.log_box.anchorClicked.connect(gui_instance.on_operation_clicked)
     log_layout.addWidget(gui_instance.log_box)
     log_container.setLayout(log_layout)
     return log_container
 
 
+def _build_log_formats(gui_instance) -> dict:
+    """Character formats for log lines, built once and reused for every insert.
+
+    "info", "warn" and "err" are status lines (log_append kinds);
+    "card_title" and "card_subtitle" are the two lines of an operation card,
+    which add_action_card copies to set the card's background and link.
+    """
+    def char_format(color, pixel_size, bold=True, families=None):
+        fmt = QTextCharFormat()
+        fmt.setForeground(QColor(color))
+        fmt.setProperty(QTextFormat.Property.FontPixelSize, pixel_size)
+        fmt.setFontWeight(QFont.Weight.Bold if bold else QFont.Weight.Normal)
+        if families:
+            fmt.setFontFamilies(families)
+        return fmt
+    
+    card_title = char_format(gui_instance.accent, 12, families=MONO_FAMILIES)
+    card_subtitle = char_format(gui_instance.text, 10, bold=False, families=MONO_FAMILIES)
+    for fmt in (card_title, card_subtitle):
+        fmt.setAnchor(True)
+    return {
+        "info": char_format(gui_instance.highlight_blue, 11),
+        "warn": char_format("#ff6600", 11),
+        "err": char_format(gui_instance.error_red, 11),
+        "card_title": card_title,
+        "card_subtitle": card_subtitle,
+    }
+
+
 def _build_input_row(gui_instance) -> None:
     """Build the input row with text field and buttons."""
     gui_instance.input_box = QLineEdit()
     gui_instance.input_box.setPlaceholderText("Type your message…")
-    gui_instance.input_box.setStyleSheet(f"""
-        QLineEdit {{
-            background-color: white;
-            color: #000000;
-            border-radius: 0px;
-            border-top: 2px inset {gui_instance.border_dark};
-            border-left: 2px inset {gui_instance.border_dark};
-            border-bottom: 2px inset {gui_instance.border_light};
-            border-right: 2px inset {gui_instance.border_light};
-            padding: 8px;
-            font-family: 'Courier New', 'Monaco', monospace;
-            font-size: 11px;
-        }}
-        QLineEdit:focus {{
-            border-top: 2px inset {gui_instance.border_dark};
-            border-left: 2px inset {gui_instance.border_dark};
-            border-bottom: 2px inset {gui_instance.border_light};
-            border-right: 2px inset {gui_instance.border_light};
-        }}
-    """)
+    gui_instance.input_box.setObjectName("inputBox")
     
     # Permissions button
     gui_instance.perms_btn = QPushButton("⚙")
+    gui_instance.perms_btn.setObjectName("permsBtn")
     gui_instance.perms_btn.setFixedWidth(55)
-    gui_instance.perms_btn.setStyleSheet(f"""
-        QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #d4d0c8, stop:1 #c0c0c0);
-            color: {gui_instance.text};
-            border-radius: 0px;
-            font-size: 18px;
-            border-top: 2px outset {gui_instance.border_light};
-            border-left: 2px outset {gui_instance.border_light};
-            border-bottom: 2px outset {gui_instance.border_dark};
-            border-right: 2px outset {gui_instance.border_dark};
-            font-weight: bold;
-        }}
-        QPushButton:hover {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #e8e4dc, stop:1 #d4d0c8);
-        }}
-        QPushButton:pressed {{
-            background: {gui_instance.button_bg};
-            border-top: 2px inset {gui_instance.border_dark};
-            border-left: 2px inset {gui_instance.border_dark};
-            border-bottom: 2px inset {gui_instance.border_light};
-            border-right: 2px inset {gui_instance.border_light};
-        }}
-    """)
     gui_instance.perms_btn.clicked.connect(gui_instance.open_permissions)
     
     # Send button
     gui_instance.send_btn = QPushButton("➤")
+    gui_instance.send_btn.setObjectName("sendBtn")
     gui_instance.send_btn.setFixedWidth(55)
-    gui_instance.send_btn.setStyleSheet(f"""
-        QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #d4d0c8, stop:1 #c0c0c0);
-            color: {gui_instance.text};
-            border-radius: 0px;
-            font-size: 20px;
-            border-top: 2px outset {gui_instance.border_light};
-            border-left: 2px outset {gui_instance.border_light};
-            border-bottom: 2px outset {gui_instance.border_dark};
-            border-right: 2px outset {gui_instance.border_dark};
-            font-weight: bold;
-        }}
-        QPushButton:hover {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #e8e4dc, stop:1 #d4d0c8);
-        }}
-        QPushButton:pressed {{
-            background: {gui_instance.button_bg};
-            border-top: 2px inset {gui_instance.border_dark};
-            border-left: 2px inset {gui_instance.border_dark};
-            border-bottom: 2px inset {gui_instance.border_light};
-            border-right: 2px inset {gui_instance.border_light};
-        }}
-        QPushButton:disabled {{
-            background-color: #a0a0a0;
-            color: #808080;
-        }}
-    """)
     gui_instance.input_box.setFocus()
     gui_instance.input_box.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
     gui_instance.send_btn.clicked.connect(gui_instance.handle_send)
     gui_instance.input_box.returnPressed.connect(gui_instance.handle_send)
 
 
+def ensure_detail_page(gui_instance) -> None:
+    """Build the operation detail page and add it as page 1 of operations_stack,
+    unless that already happened."""
+    if gui_instance._detail_page is None:
+        gui_instance._detail_page = _build_detail_page(gui_instance)
+        gui_instance.operations_stack.addWidget(gui_instance._detail_page)
+
+
 def _build_detail_page(gui_instance) -> QWidget:
     """Build the operation detail view page."""
     detail_page = QWidget()
@@ -303,57 +233,24 @@ def _build_detail_page(gui_instance) -> QWidget:
     back_header = QWidget()
     back_header_layout = QHBoxLayout()
     back_header_layout.setContentsMargins(4, 4, 4, 4)
-    back_btn = QPushButton("← Back")
-    back_btn.setStyleSheet(f"""
-        QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #d4d0c8, stop:1 #c0c0c0);
-            color: {gui_instance.text};
-            border-radius: 0px;
-            font-size: 11px;
-            font-weight: bold;
-            padding: 6px 12px;
-            border-top: 2px outset {gui_instance.border_light};
-            border-left: 2px outset {gui_instance.border_light};
-            border-bottom: 2px outset {gui_instance.border_dark};
-            border-right: 2px outset {gui_instance.border_dark};
-        }}
-        QPushButton:hover {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #e8e4dc, stop:1 #d4d0c8);
-        }}
-        QPushButton:pressed {{
-            border-top: 2px inset {gui_instance.border_dark};
-            border-left: 2px inset {gui_instance.border_dark};
-            border-bottom: 2px inset {gui_instance.border_light};
-            border-right: 2px inset {gui_instance.border_light};
-        }}
-    """)
+    back_btn = _tool_button("← Back")
+    back_btn.setObjectName("backBtn")
     back_btn.clicked.connect(lambda: gui_instance.operations_stack.setCurrentIndex(0))
     back_header_layout.addWidget(back_btn)
     back_header_layout.addStretch()
     back_header.setLayout(back_header_layout)
-    back_header.setStyleSheet(f"""
-        background-color: {gui_instance.button_bg};
-        border-bottom: 1px solid {gui_instance.border_dark};
-    """)
+    back_header.setObjectName("backHeader")
     detail_layout.addWidget(back_header)
     
     # Detail content
     gui_instance.operation_detail_label = QTextBrowser()
     gui_instance.operation_detail_label.setReadOnly(True)
+    # Display only: no undo history for the setHtml() refreshes, no link navigation
+    gui_instance.operation_detail_label.setUndoRedoEnabled(False)
+    gui_instance.operation_detail_label.setOpenLinks(False)
     gui_instance.operation_detail_label.setWordWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
     gui_instance.operation_detail_label.setText("Click an operation above to see details")
-    gui_instance.operation_detail_label.setStyleSheet(f"""
-        QTextBrowser {{
-            background-color: {gui_instance.panel};
-            color: {gui_instance.text};
-            border: none;
-            padding: 15px;
-            font-family: 'Courier New', 'Monaco', monospace;
-            font-size: 11px;
-        }}
-    """)
+    gui_instance.operation_detail_label.setObjectName("operationDetail")
     detail_layout.addWidget(gui_instance.operation_detail_label)
     detail_page.setLayout(detail_layout)
     return detail_page
@@ -368,19 +265,7 @@ def _build_counters_widget(gui_instance) -> QWidget:
     counters_layout.addWidget(gui_instance.files_moved_label)
     counters_layout.addWidget(gui_instance.time_label)
     counters_widget.setLayout(counters_layout)
-    counters_widget.setStyleSheet(f"""
-        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 #d4d0c8, stop:1 #c0c0c0);
-        border-radius: 0px;
-        padding: 8px;
-        border-top: 2px inset {gui_instance.border_dark};
-        border-left: 2px inset {gui_instance.border_dark};
-        border-bottom: 2px inset {gui_instance.border_light};
-        border-right: 2px inset {gui_instance.border_light};
-        color: {gui_instance.text};
-        font-family: 'Courier New', 'Monaco', monospace;
-        font-weight: bold;
-    """)
+    counters_widget.setObjectName("counters")
     return counters_widget
 
 
@@ -402,19 +287,7 @@ def build_preferences_panel(gui_instance) -> QWidget:
     # Title bar
     title = QLabel("  PREFERENCES")
     title.setFixedHeight(18)
-    title.setStyleSheet(f"""
-        QLabel {{
-            background-color: {gui_instance.button_bg};
-            color: {gui_instance.text};
-            font-family: 'Courier New', 'Monaco', monospace;
-            font-size: 9px;
-            font-weight: bold;
-            padding-left: 6px;
-            border-top: 2px inset {gui_instance.border_dark};
-            border-left: 2px inset {gui_instance.border_dark};
-            border-bottom: 1px solid {gui_instance.border_dark};
-        }}
-    """)
+    title.setObjectName("prefsTitle")
     layout.addWidget(title)
     
     # Content area with horizontal sections
@@ -434,21 +307,51 @@ def build_preferences_panel(gui_instance) -> QWidget:
     content.setLayout(content_layout)
     layout.addWidget(content)
     panel.setLayout(layout)
-    panel.setStyleSheet(f"""
-        QWidget {{
-            background-color: {gui_instance.panel};
-            border: 2px inset {gui_instance.border_dark};
-        }}
-    """)
-    
-    # Load existing categories and notes
-    gui_instance._refresh_categories_list()
+    panel.setObjectName("prefsPanel")
+    
+    # Adding the root's subfolders also refreshes the categories list. It runs
+    # now, before showEvent starts the IndexingWorker, since it saves memory.
+    # Notes are loaded after the first paint; they are usually the bigger list.
     gui_instance._auto_add_directory_categories()
-    gui_instance._refresh_notes_list()
+    QTimer.singleShot(0, gui_instance._refresh_notes_list)
     
     return panel
 
 
+def _tool_button(text: str) -> QToolButton:
+    """Text-only QToolButton for the small panel buttons.
+
+    Lighter than QPushButton (no focus frame or default-button handling) and
+    sized like one, so it still stretches to fill its row.
+    """
+    button = QToolButton()
+    button.setText(text)
+    button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
+    button.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+    return button
+
+
+def _build_list_view(model) -> QListView:
+    """List view over model for the preferences panel.
+
+    Rows in each list share one height, so uniform item sizes let the view
+    skip measuring every row; batched layout keeps big refreshes responsive.
+    """
+    view = QListView()
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.LayoutMode.Batched)
+    view.setBatchSize(100)
+    # Long rows are elided rather than scrolled, so the view never has to
+    # find the widest row to size a horizontal scroll range
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+    view.setTextElideMode(Qt.TextElideMode.ElideRight)
+    view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+    view.setModel(model)
+    # Keep the model alive with the view
+    model.setParent(view)
+    return view
+
+
 def _build_categories_section(gui_instance) -> QWidget:
     """Build the categories section of the preferences panel."""
     categories_group = QWidget()
@@ -458,7 +361,7 @@ def _build_categories_section(gui_instance) -> QWidget:
     
     cat_label = QLabel("Categories:")
     cat_label.setFixedHeight(14)
-    cat_label.setStyleSheet(f"font-size: 8px; font-weight: bold; color: {gui_instance.text};")
+    cat_label.setObjectName("sectionLabel")
     categories_layout.addWidget(cat_label)
     
     # Category input and add button
@@ -466,30 +369,11 @@ def _build_categories_section(gui_instance) -> QWidget:
     cat_input_row.setSpacing(4)
     gui_instance.category_input = QLineEdit()
     gui_instance.category_input.setPlaceholderText("New category...")
-    gui_instance.category_input.setStyleSheet(f"""
-        QLineEdit {{
-            background-color: white;
-            color: #000000;
-            border: 1px inset {gui_instance.border_dark};
-            padding: 2px 4px;
-            font-size: 9px;
-        }}
-    """)
+    gui_instance.category_input.setObjectName("categoryInput")
     gui_instance.category_input.setMaximumHeight(20)
-    add_cat_btn = QPushButton("+")
+    add_cat_btn = _tool_button("+")
     add_cat_btn.setFixedSize(20, 20)
-    add_cat_btn.setStyleSheet(f"""
-        QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #d4d0c8, stop:1 #c0c0c0);
-            border: 1px outset {gui_instance.border_light};
-            font-size: 12px;
-            font-weight: bold;
-        }}
-        QPushButton:pressed {{
-            border: 1px inset {gui_instance.border_dark};
-        }}
-    """)
+    add_cat_btn.setObjectName("addCategoryBtn")
     add_cat_btn.clicked.connect(gui_instance._add_category)
     gui_instance.category_input.returnPressed.connect(gui_instance._add_category)
     cat_input_row.addWidget(gui_instance.category_input)
@@ -497,19 +381,9 @@ def _build_categories_section(gui_instance) -> QWidget:
     categories_layout.addLayout(cat_input_row)
     
     # Categories list
-    gui_instance.categories_list = QListWidget()
+    gui_instance.categories_list = _build_list_view(CategoriesModel())
     gui_instance.categories_list.setMaximumHeight(100)
-    gui_instance.categories_list.setStyleSheet(f"""
-        QListWidget {{
-            background-color: white;
-            border: 1px inset {gui_instance.border_dark};
-            font-size: 9px;
-            color: {gui_instance.text};
-        }}
-        QListWidget::item {{
-            color: {gui_instance.text};
-        }}
-    """)
+    gui_instance.categories_list.setObjectName("categoriesList")
     gui_instance.categories_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
     gui_instance.categories_list.customContextMenuRequested.connect(gui_instance._show_category_context_menu)
     categories_layout.addWidget(gui_instance.categories_list)
@@ -526,7 +400,7 @@ def _build_notes_section(gui_instance) -> QWidget:
     
     notes_label = QLabel("File Notes:")
     notes_label.setFixedHeight(14)
-    notes_label.setStyleSheet(f"font-size: 8px; font-weight: bold; color: {gui_instance.text};")
+    notes_label.setObjectName("sectionLabel")
     notes_layout.addWidget(notes_label)
     
     # Button row for refresh and generate notes
@@ -534,40 +408,16 @@ def _build_notes_section(gui_instance) -> QWidget:
     button_row.setSpacing(4)
     
     # Refresh index button
-    refresh_index_btn = QPushButton("Refresh Index")
+    refresh_index_btn = _tool_button("Refresh Index")
     refresh_index_btn.setFixedHeight(22)
-    refresh_index_btn.setStyleSheet(f"""
-        QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #d4d0c8, stop:1 #c0c0c0);
-            border: 1px outset {gui_instance.border_light};
-            font-size: 8px;
-            font-weight: bold;
-            color: {gui_instance.text};
-        }}
-        QPushButton:pressed {{
-            border: 1px inset {gui_instance.border_dark};
-        }}
-    """)
+    refresh_index_btn.setObjectName("refreshIndexBtn")
     refresh_index_btn.clicked.connect(gui_instance._force_refresh_index)
     button_row.addWidget(refresh_index_btn)
     
     # Generate notes button
-    generate_notes_btn = QPushButton("Generate Notes")
+    generate_notes_btn = _tool_button("Generate Notes")
     generate_notes_btn.setFixedHeight(22)
-    generate_notes_btn.setStyleSheet(f"""
-        QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #d4d0c8, stop:1 #c0c0c0);
-            border: 1px outset {gui_instance.border_light};
-            font-size: 8px;
-            font-weight: bold;
-            color: {gui_instance.text};
-        }}
-        QPushButton:pressed {{
-            border: 1px inset {gui_instance.border_dark};
-        }}
-    """)
+    generate_notes_btn.setObjectName("generateNotesBtn")
     generate_notes_btn.clicked.connect(gui_instance._generate_notes_for_all_files)
     button_row.addWidget(generate_notes_btn)
     
@@ -576,35 +426,16 @@ def _build_notes_section(gui_instance) -> QWidget:
     # Notes list label
     notes_list_label = QLabel("File Notes (double-click to edit):")
     notes_list_label.setFixedHeight(12)
-    notes_list_label.setStyleSheet(f"font-size: 7px; font-weight: bold; color: {gui_instance.text};")
+    notes_list_label.setObjectName("notesListLabel")
     notes_layout.addWidget(notes_list_label)
     
     # Notes list
-    gui_instance.notes_list = QListWidget()
+    gui_instance.notes_list = _build_list_view(NotesModel())
     gui_instance.notes_list.setMinimumHeight(120)
-    gui_instance.notes_list.setStyleSheet(f"""
-        QListWidget {{
-            background-color: white;
-            border: 2px inset {gui_instance.border_dark};
-            font-size: 9px;
-            color: {gui_instance.text};
-        }}
-        QListWidget::item {{
-            color: {gui_instance.text};
-            padding: 4px 2px;
-            border-bottom: 1px solid #e0e0e0;
-        }}
-        QListWidget::item:selected {{
-            background-color: #0080ff;
-            color: white;
-        }}
-        QListWidget::item:hover {{
-            background-color: #e0e0e0;
-        }}
-    """)
+    gui_instance.notes_list.setObjectName("notesList")
     gui_instance.notes_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
     gui_instance.notes_list.customContextMenuRequested.connect(gui_instance._show_note_context_menu)
-    gui_instance.notes_list.itemDoubleClicked.connect(gui_instance._edit_note)
+    gui_instance.notes_list.doubleClicked.connect(gui_instance._edit_note)
     notes_layout.addWidget(gui_instance.notes_list)
     notes_group.setLayout(notes_layout)
     return notes_group
@@ -2,12 +2,89 @@
 UI COMPONENTS MODULE
 
 Reusable UI components for the application, including CustomTitleBar for the
-Windows 95-style title bar with drag-to-move functionality.
+Windows 95-style title bar with drag-to-move functionality, ChatView for the
+conversation and OperationLog for the clickable file operations log.
 """
 
-from PyQt6.QtCore import Qt, QPoint
-from PyQt6.QtGui import QPainter, QLinearGradient, QColor
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QLabel
+import time
+
+from PyQt6.QtCore import Qt, QEvent, QPoint, QRect, QSize, QTimer, QUrl, pyqtSignal
+from PyQt6.QtGui import (
+    QPainter, QLinearGradient, QColor, QIcon, QPixmap, QTextCursor, QTextBlockFormat, QTextCharFormat
+)
+from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout, QPushButton, QLabel, QPlainTextEdit
+
+
+# Window drags move the window at most once per ~16 ms (about 60 Hz); high
+# polling rate mice otherwise trigger a move and repaint per event
+DRAG_MOVE_INTERVAL_NS = 16_000_000
+
+# Window title - transparent background so the gradient shows through
+_TITLE_LABEL_QSS = """
+    QLabel {
+        background: transparent;
+        color: white;
+        font-family: 'Courier New', 'Monaco', monospace;
+        font-size: 11px;
+        font-weight: bold;
+        padding-left: 8px;
+    }
+"""
+
+# Minimize/maximize/close buttons share one stylesheet; only the glyph size
+# and the close button's red hover differ
+_WINDOW_BUTTON_QSS = """
+    QPushButton {
+        background-color: #c0c0c0;
+        color: black;
+        border: 1px outset #ffffff;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #d4d0c8;
+    }
+    QPushButton:pressed {
+        border: 1px inset #808080;
+    }
+    QPushButton#minBtn {
+        font-size: 14px;
+    }
+    QPushButton#maxBtn {
+        font-size: 12px;
+    }
+    QPushButton#closeBtn {
+        font-size: 16px;
+    }
+    QPushButton#closeBtn:hover {
+        background-color: #ff0000;
+        color: white;
+    }
+"""
+
+# Window button glyphs, keyed by (glyph, font, color); rendered once per process
+_TITLE_ICONS = {}
+# Inside of a 20x20 window button (1px border on each side)
+_TITLE_ICON_SIZE = QSize(18, 18)
+
+
+def _title_icon(glyph, font, color):
+    """Window button glyph pre-rendered to an icon, so repaints (e.g. while
+    dragging the window) blit a pixmap instead of shaping text."""
+    key = (glyph, font.key(), color)
+    icon = _TITLE_ICONS.get(key)
+    if icon is None:
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(_TITLE_ICON_SIZE * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(QRect(QPoint(0, 0), _TITLE_ICON_SIZE), Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+        icon = QIcon(pixmap)
+        _TITLE_ICONS[key] = icon
+    return icon
 
 
 # CustomTitleBar creates a Windows 95-style title bar with drag-to-move.
@@ -19,6 +96,11 @@ class CustomTitleBar(QWidget):
         self.parent_window = parent
         self.drag_position = QPoint()
         self.setFixedHeight(30)
+        self._bg_cache = QPixmap()  # Gradient background, rebuilt on resize
+        # Drag-move throttling (see mouseMoveEvent)
+        self._last_move_ns = 0
+        self._pending_pos = QPoint()
+        self._move_pending = False
         
         layout = QHBoxLayout()
         layout.setContentsMargins(4, 2, 4, 2)
@@ -26,81 +108,37 @@ class CustomTitleBar(QWidget):
         
         # Window title - transparent background so gradient shows through
         self.title_label = QLabel("File Sorter AI")
-        self.title_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                color: white;
-                font-family: 'Courier New', 'Monaco', monospace;
-                font-size: 11px;
-                font-weight: bold;
-                padding-left: 8px;
-            }
-        """)
+        self.title_label.setStyleSheet(_TITLE_LABEL_QSS)
         layout.addWidget(self.title_label)
         layout.addStretch()
         
         # Window buttons (Windows 95 style)
         # Minimize button
-        self.min_btn = QPushButton("_")
+        self.min_btn = QPushButton()
+        self.min_btn.setObjectName("minBtn")
         self.min_btn.setFixedSize(20, 20)
-        self.min_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c0c0c0;
-                color: black;
-                border: 1px outset #ffffff;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #d4d0c8;
-            }
-            QPushButton:pressed {
-                border: 1px inset #808080;
-            }
-        """)
+        self.min_btn.setStyleSheet(_WINDOW_BUTTON_QSS)
+        self._set_glyph(self.min_btn, "_")
         self.min_btn.clicked.connect(parent.showMinimized)
         layout.addWidget(self.min_btn)
         
         # Maximize/Restore button
-        self.max_btn = QPushButton("□")
+        self.max_btn = QPushButton()
+        self.max_btn.setObjectName("maxBtn")
         self.max_btn.setFixedSize(20, 20)
-        self.max_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c0c0c0;
-                color: black;
-                border: 1px outset #ffffff;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #d4d0c8;
-            }
-            QPushButton:pressed {
-                border: 1px inset #808080;
-            }
-        """)
+        self.max_btn.setStyleSheet(_WINDOW_BUTTON_QSS)
+        self._set_glyph(self.max_btn, "□")
         self.max_btn.clicked.connect(self.toggle_maximize)
         layout.addWidget(self.max_btn)
         
         # Close button
-        self.close_btn = QPushButton("×")
+        self.close_btn = QPushButton()
+        self.close_btn.setObjectName("closeBtn")
         self.close_btn.setFixedSize(20, 20)
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c0c0c0;
-                color: black;
-                border: 1px outset #ffffff;
-                font-weight: bold;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #ff0000;
-                color: white;
-            }
-            QPushButton:pressed {
-                border: 1px inset #808080;
-            }
-        """)
+        self.close_btn.setStyleSheet(_WINDOW_BUTTON_QSS)
+        self._set_glyph(self.close_btn, "×")
+        # Swaps in the white glyph on the red hover background
+        self.close_btn.installEventFilter(self)
         self.close_btn.clicked.connect(parent.close)
         layout.addWidget(self.close_btn)
         
@@ -110,23 +148,52 @@ class CustomTitleBar(QWidget):
         # Use paintEvent to ensure gradient is drawn
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, False)
     
-    def paintEvent(self, event):
-        """Paint the gradient background"""
-        painter = QPainter(self)
+    def _set_glyph(self, button, glyph, color="black"):
+        """Show glyph on button as a cached icon, in the button's stylesheet font"""
+        button.ensurePolished()
+        button.setIcon(_title_icon(glyph, button.font(), color))
+        button.setIconSize(_TITLE_ICON_SIZE)
+    
+    def eventFilter(self, obj, event):
+        if obj is self.close_btn and event.type() in (QEvent.Type.Enter, QEvent.Type.Leave):
+            color = "white" if event.type() == QEvent.Type.Enter else "black"
+            self._set_glyph(self.close_btn, "×", color)
+        return super().eventFilter(obj, event)
+    
+    def _build_background(self):
+        """Render the gradient once into a pixmap the size of the bar"""
+        ratio = self.devicePixelRatioF()
+        self._bg_cache = QPixmap(self.size() * ratio)
+        self._bg_cache.setDevicePixelRatio(ratio)
+        painter = QPainter(self._bg_cache)
         gradient = QLinearGradient(0, 0, 0, self.height())
         gradient.setColorAt(0, QColor("#0080ff"))
         gradient.setColorAt(0.5, QColor("#0073e6"))
         gradient.setColorAt(1, QColor("#0066cc"))
         painter.fillRect(self.rect(), gradient)
+        painter.end()
+    
+    def resizeEvent(self, event):
+        self._build_background()
+        super().resizeEvent(event)
+    
+    def paintEvent(self, event):
+        """Paint the cached gradient background"""
+        # Screen changes can alter the pixel ratio without a resize
+        if self._bg_cache.devicePixelRatio() != self.devicePixelRatioF():
+            self._build_background()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_cache)
+        painter.end()
         super().paintEvent(event)
     
     def toggle_maximize(self):
         if self.parent_window.isMaximized():
             self.parent_window.showNormal()
-            self.max_btn.setText("□")
+            self._set_glyph(self.max_btn, "□")
         else:
             self.parent_window.showMaximized()
-            self.max_btn.setText("❐")
+            self._set_glyph(self.max_btn, "❐")
     
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -136,6 +203,144 @@ class CustomTitleBar(QWidget):
     def mouseMoveEvent(self, event):
         if event.buttons() == Qt.MouseButton.LeftButton:
             if self.drag_position:
-                self.parent_window.move(event.globalPosition().toPoint() - self.drag_position)
+                # Keep only the latest target; moves are applied at most once a frame
+                self._pending_pos = event.globalPosition().toPoint() - self.drag_position
+                if not self._move_pending:
+                    self._move_pending = True
+                    wait_ns = self._last_move_ns + DRAG_MOVE_INTERVAL_NS - time.monotonic_ns()
+                    QTimer.singleShot(max(0, wait_ns // 1_000_000), self._apply_pending_move)
             event.accept()
+    
+    def _apply_pending_move(self):
+        self._move_pending = False
+        self._last_move_ns = time.monotonic_ns()
+        self.parent_window.move(self._pending_pos)
+
+
+# Appends arriving within this window are written to the document together
+APPEND_FLUSH_MS = 50
+
 
+# Read-only QPlainTextEdit behind ChatView and OperationLog. The block-based
+# layout stays fast with long transcripts where QTextEdit/QTextBrowser slow
+# down. append() and append_fragments() queue lines and a single-shot timer
+# writes them in one edit block, so a burst of status lines costs one
+# layout/repaint instead of one per line. Only character formats (colors,
+# fonts, anchors) survive from HTML; images and block styling are dropped.
+class _BufferedTextView(QPlainTextEdit):
+    def __init__(self, max_blocks, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        # Drop the oldest lines once the view is full
+        self.setMaximumBlockCount(max_blocks)
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(APPEND_FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append(self, html):
+        """Queue one HTML snippet to be added as a new block."""
+        self._queue(html)
+
+    def append_fragments(self, fragments):
+        """Queue one line made of (text, QTextCharFormat) pairs.
+
+        Skips the HTML parser entirely; callers keep prebuilt formats around.
+        """
+        self._queue(fragments)
+
+    def _queue(self, line):
+        self._pending.append(line)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """Write all queued snippets now."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        document = self.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for line in pending:
+            if not document.isEmpty():
+                # Fresh formats so one line's colors don't bleed into the next
+                cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
+            if isinstance(line, str):
+                cursor.insertHtml(line)
+            else:
+                for text, fmt in line:
+                    cursor.insertText(text, fmt)
+        cursor.endEditBlock()
+        # Follow the new lines unless the user has scrolled up
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+
+# ChatView is the conversation window. The "Thinking..." line is tracked with
+# a QTextCursor so it can be swapped out in place instead of round-tripping
+# the whole transcript through toHtml()/setHtml().
+class ChatView(_BufferedTextView):
+    def __init__(self, max_blocks, parent=None):
+        super().__init__(max_blocks, parent)
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        self._thinking_cursor = None
+
+    def append_thinking(self, html):
+        """Append the placeholder shown while waiting for a reply."""
+        self._pending.append(html)
+        self.flush()
+        # Document edits (including block cap trimming) keep this cursor in place
+        self._thinking_cursor = QTextCursor(self.document().lastBlock())
+
+    def replace_thinking(self, html=None):
+        """Swap the placeholder line for html, or remove it if html is None."""
+        cursor = self._thinking_cursor
+        self._thinking_cursor = None
+        if cursor is None:
+            return
+        cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
+        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+        if html is not None:
+            cursor.insertHtml(html)
+            return
+        cursor.removeSelectedText()
+        # Drop the now empty line too
+        if cursor.atStart():
+            cursor.deleteChar()
+        else:
+            cursor.deletePreviousChar()
+
+
+# OperationLog is the file operations log. Anchor clicks are detected by hand
+# and re-emitted as anchorClicked, like QTextBrowser does.
+class OperationLog(_BufferedTextView):
+    anchorClicked = pyqtSignal(QUrl)
+
+    def __init__(self, max_blocks, parent=None):
+        super().__init__(max_blocks, parent)
+        # Needed for mouseMoveEvent without a button held (hand cursor on links)
+        self.viewport().setMouseTracking(True)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            href = self.anchorAt(event.position().toPoint())
+            if href:
+                self.anchorClicked.emit(QUrl(href))
+                event.accept()
+                return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self.anchorAt(event.position().toPoint()):
+            self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        else:
+            self.viewport().unsetCursor()
+        super().mouseMoveEvent(event)
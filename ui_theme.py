@@ -0,0 +1,55 @@
+"""
+UI THEME MODULE
+
+Builds the single Windows 95-style stylesheet for the main window. The rules
+live in resources/ui_theme.qss with @TOKEN@ placeholders for the palette
+colors; widgets are matched by objectName (set in ui_builder), so the whole
+window is styled with one setStyleSheet call instead of one per widget.
+
+The monospace font is not part of the sheet: mono_font() is set once on the
+main window and inherited by every widget in it, so only rules that need a
+different size or weight mention the font at all.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from PyQt6.QtGui import QFont
+
+QSS_PATH = Path(__file__).resolve().parent / "resources" / "ui_theme.qss"
+
+# Placeholder in ui_theme.qss for each palette entry, in palette order
+_PALETTE_TOKENS = ("@BG@", "@PANEL@", "@TEXT@", "@BORDER_DARK@", "@BORDER_LIGHT@", "@BUTTON_BG@")
+
+MONO_FAMILIES = ["Courier New", "Monaco", "monospace"]
+# Size of the main window's base font; ui_theme.qss only overrides the others
+MONO_PIXEL_SIZE = 11
+
+
+@lru_cache(maxsize=1)
+def _qss_template() -> str:
+    """Raw ui_theme.qss, read from disk once per process."""
+    return QSS_PATH.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def build_global_qss(palette: tuple) -> str:
+    """Return the main window stylesheet for a palette.
+
+    palette is (bg, panel, text, border_dark, border_light, button_bg). The
+    result is cached per palette; call build_global_qss.cache_clear() if the
+    theme colors change.
+    """
+    qss = _qss_template()
+    for token, color in zip(_PALETTE_TOKENS, palette):
+        qss = qss.replace(token, color)
+    return qss
+
+
+def mono_font(pixel_size: int = MONO_PIXEL_SIZE) -> QFont:
+    """The window's monospace font at pixel_size."""
+    font = QFont()
+    font.setFamilies(MONO_FAMILIES)
+    font.setStyleHint(QFont.StyleHint.TypeWriter)
+    font.setPixelSize(pixel_size)
+    return font
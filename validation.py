@@ -5,7 +5,7 @@ Validates AI responses to ensure they contain valid actions and arguments
 before executing file operations. Prevents invalid commands from being executed.
 """
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 # ALLOWED ACTIONS THAT THE AI CAN REQUEST
 ALLOWED_ACTIONS = {
@@ -29,6 +29,25 @@ _REQUIRED_ARGS = {
     "file_type": ("path",),
 }
 
+# OPTIONAL ARGUMENTS THAT ARE COERCED TO INT WHEN PRESENT
+_OPTIONAL_INT_ARGS = {
+    "list_files": ("limit",),
+}
+
+# ACTIONS THAT MAY OMIT 'path' (THE ACTION HANDLER PICKS A DEFAULT OR ASKS THE USER)
+_PATH_OPTIONAL_ACTIONS = frozenset({
+    "create_folder",
+    "list_files",
+    "list_all_files",
+    "read_file",
+    "file_type",
+})
+
+
+def _chat_fallback(message: str = "") -> dict:
+    """Normalized chat-only action returned alongside a validation error."""
+    return {"action": "chat", "args": {}, "message": message}
+
 
 def validate_ai_payload(ai: object) -> Tuple[bool, dict, str]:
     """
@@ -47,36 +66,45 @@ def validate_ai_payload(ai: object) -> Tuple[bool, dict, str]:
     """
     # HANDLE ARRAY OF ACTIONS
     if isinstance(ai, list):
-        validated_actions = []
-        for i, action_item in enumerate(ai):
-            if not isinstance(action_item, dict):
-                return False, {"action": "chat", "args": {}, "message": ""}, f"Action {i+1} in array is not a JSON object."
-            ok, normalized, err = validate_single_action(action_item)
-            if not ok:
-                return False, {"action": "chat", "args": {}, "message": ""}, f"Action {i+1}: {err}"
-            validated_actions.append(normalized)
+        validated_actions, err = _validate_action_list(ai)
+        if validated_actions is None:
+            return False, _chat_fallback(), err
         return True, {"actions": validated_actions, "message": f"Executing {len(validated_actions)} action(s)"}, ""
     
     # HANDLE INVALID TYPE
     if not isinstance(ai, dict):
-        return False, {"action": "chat", "args": {}, "message": ""}, "AI output is not a JSON object."
+        return False, _chat_fallback(), "AI output is not a JSON object."
     
     # HANDLE MULTI-ACTION FORMAT (dict with "actions" key)
     if "actions" in ai and isinstance(ai["actions"], list):
-        validated_actions = []
-        for i, action_item in enumerate(ai["actions"]):
-            if not isinstance(action_item, dict):
-                return False, {"action": "chat", "args": {}, "message": ""}, f"Action {i+1} in array is not a JSON object."
-            ok, normalized, err = validate_single_action(action_item)
-            if not ok:
-                return False, {"action": "chat", "args": {}, "message": ""}, f"Action {i+1}: {err}"
-            validated_actions.append(normalized)
+        validated_actions, err = _validate_action_list(ai["actions"])
+        if validated_actions is None:
+            return False, _chat_fallback(), err
         return True, {"actions": validated_actions, "message": ai.get("message", f"Executing {len(validated_actions)} action(s)")}, ""
     
     # HANDLE SINGLE ACTION
     return validate_single_action(ai)
 
 
+def _validate_action_list(items: list) -> Tuple[Optional[List[dict]], str]:
+    """
+    Validate every action in a multi-action list, stopping at the first bad one.
+    
+    Returns:
+        (normalized_actions, "") if all are valid, else (None, error_message)
+    """
+    validate = validate_single_action
+    validated_actions = [None] * len(items)
+    for i, action_item in enumerate(items):
+        if not isinstance(action_item, dict):
+            return None, f"Action {i+1} in array is not a JSON object."
+        ok, normalized, err = validate(action_item)
+        if not ok:
+            return None, f"Action {i+1}: {err}"
+        validated_actions[i] = normalized
+    return validated_actions, ""
+
+
 def validate_single_action(ai: dict) -> Tuple[bool, dict, str]:
     """
     Validate a single action dictionary.
@@ -95,54 +123,96 @@ def validate_single_action(ai: dict) -> Tuple[bool, dict, str]:
     # CHECK ACTION FIELD EXISTS
     action = ai.get("action")
     if not isinstance(action, str) or not action.strip():
-        return False, {"action": "chat", "args": {}, "message": ""}, "Missing or invalid 'action' field."
+        return False, _chat_fallback(), "Missing or invalid 'action' field."
 
     action = action.strip()
 
-    # CHECK ACTION IS ALLOWED
-    if action not in ALLOWED_ACTIONS:
-        return False, {"action": "chat", "args": {}, "message": ai.get("message", "")}, f"Unknown action '{action}'."
+    # DISPATCH TO THE ACTION'S OWN VALIDATOR (UNKNOWN ACTIONS HAVE NONE)
+    validator = _VALIDATORS.get(action)
+    if validator is None:
+        return False, _chat_fallback(ai.get("message", "")), f"Unknown action '{action}'."
+    return validator(ai)
 
-    # NORMALIZE ARGS AND MESSAGE
+
+def _read_args_and_message(ai: dict):
+    """
+    Normalize the 'args' and 'message' fields of an action.
+    
+    Returns:
+        (args, message), or None if 'args' is present but not an object
+    """
     args = ai.get("args", {})
     if args is None:
         args = {}
     if not isinstance(args, dict):
-        return False, {"action": "chat", "args": {}, "message": ai.get("message", "")}, "Invalid 'args' (must be an object)."
+        return None
 
     message = ai.get("message", "")
     if message is None:
         message = ""
     if not isinstance(message, str):
         message = str(message)
+    return args, message
 
-    # TREAT 'NONE' AS CHAT-ONLY TO AVOID ODD UI STATES
-    if action == "none":
-        return True, {"action": "chat", "args": {}, "message": message or "No file action required."}, ""
 
-    # VALIDATE REQUIRED ARGUMENTS FOR TOOL ACTIONS
-    required = _REQUIRED_ARGS.get(action, tuple())
-    missing = [k for k in required if not isinstance(args.get(k), str) or not args.get(k).strip()]
-    
-    # SPECIAL HANDLING: ALLOW MISSING PATH FOR ACTIONS THAT CAN SCAN ALL ACCESSIBLE DIRECTORIES
-    # Don't fail validation - let the action handler add default paths or ask user
-    if action in ["create_folder", "list_files", "list_all_files", "read_file", "file_type"] and "path" in missing:
-        # Add empty string - action handler will add default path(s) or ask user to choose
-        args["path"] = ""  # Empty string will be handled by action handler
-        missing.remove("path")
-    
-    if missing:
-        return False, {"action": "chat", "args": {}, "message": message}, f"Missing required args for '{action}': {', '.join(missing)}."
-
-    # NORMALIZE COMMON OPTIONAL ARGS
-    if action == "list_files":
-        # Optional 'limit' (int)
-        if "limit" in args and args["limit"] is not None:
-            try:
-                args["limit"] = int(args["limit"])
-            except Exception:
-                return False, {"action": "chat", "args": {}, "message": message}, "Invalid 'limit' (must be an integer)."
+def _validate_none(ai: dict) -> Tuple[bool, dict, str]:
+    """Validator for 'none': treated as chat-only to avoid odd UI states."""
+    parsed = _read_args_and_message(ai)
+    if parsed is None:
+        return False, _chat_fallback(ai.get("message", "")), "Invalid 'args' (must be an object)."
+    message = parsed[1]
+    return True, _chat_fallback(message or "No file action required."), ""
 
-    # RETURN NORMALIZED ACTION DICT
-    return True, {"action": action, "args": args, "message": message}, ""
 
+def _make_validator(action: str):
+    """
+    Build the validator for one allowed action.
+    
+    The action's required args, whether 'path' may be omitted and which
+    optional args are coerced to int are looked up once here, so the
+    returned function only runs the checks this action needs.
+    """
+    required = _REQUIRED_ARGS.get(action, ())
+    path_optional = action in _PATH_OPTIONAL_ACTIONS
+    int_args = _OPTIONAL_INT_ARGS.get(action, ())
+
+    def validate(ai: dict) -> Tuple[bool, dict, str]:
+        parsed = _read_args_and_message(ai)
+        if parsed is None:
+            return False, _chat_fallback(ai.get("message", "")), "Invalid 'args' (must be an object)."
+        args, message = parsed
+
+        # VALIDATE REQUIRED ARGUMENTS
+        missing = []
+        for k in required:
+            value = args.get(k)
+            if not isinstance(value, str) or not value.strip():
+                missing.append(k)
+        
+        # SPECIAL HANDLING: ALLOW MISSING PATH FOR ACTIONS THAT CAN SCAN ALL ACCESSIBLE DIRECTORIES
+        # Don't fail validation - let the action handler add default paths or ask user
+        if path_optional and "path" in missing:
+            # Add empty string - action handler will add default path(s) or ask user to choose
+            args["path"] = ""  # Empty string will be handled by action handler
+            missing.remove("path")
+        
+        if missing:
+            return False, _chat_fallback(message), f"Missing required args for '{action}': {', '.join(missing)}."
+
+        # NORMALIZE OPTIONAL INTEGER ARGS
+        for k in int_args:
+            if k in args and args[k] is not None:
+                try:
+                    args[k] = int(args[k])
+                except Exception:
+                    return False, _chat_fallback(message), f"Invalid '{k}' (must be an integer)."
+
+        # RETURN NORMALIZED ACTION DICT
+        return True, {"action": action, "args": args, "message": message}, ""
+
+    return validate
+
+
+# ONE VALIDATOR PER ALLOWED ACTION, BUILT ONCE AT IMPORT
+_VALIDATORS = {action: _make_validator(action) for action in ALLOWED_ACTIONS}
+_VALIDATORS["none"] = _validate_none
@@ -2,19 +2,62 @@
 WORKERS MODULE
 
 Background thread workers that handle time-consuming operations off the main
-UI thread. Includes AIWorker for AI processing and IndexingWorker for file
-indexing and note generation.
+UI thread. Includes AIWorker for AI processing, IndexingWorker for file
+indexing and note generation, and NoteGenerationWorker for on-demand notes.
 """
 
+import logging
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from config import OLLAMA_GENERATE_URL, get_ai_model
+from fileIndex import set_all_files, invalidate_keyword_index, root_files_without_notes
 from filenameParser import parse_file_info
-from contentReader import read_file_content
-from contentAnalyzer import analyze_file
+from contentReader import read_file_content, can_read_content
+from contentAnalyzer import analyze_file, analyze_files_batch, ANALYSIS_BATCH_SIZE, MAX_CONCURRENT_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+# Files read at once by IndexingWorker's indexing pass when content reading is on
+INDEX_READ_WORKERS = 4
+
+# (label, parsed key) pairs copied into generated notes, in order
+_NOTE_FIELDS = (("Course", "course"), ("Type", "type"), ("Date", "date"))
+
+
+def _build_note(file_info: dict) -> str:
+    """Short auto note for an indexed file: parsed filename fields, then the
+    content summary (or keywords). Empty string if there is nothing to say."""
+    note_parts = []
+    append = note_parts.append
+    
+    parsed = file_info.get("parsed")
+    if parsed:
+        for label, key in _NOTE_FIELDS:
+            value = parsed.get(key)
+            if value:
+                append(f"{label}: {value}")
+        subject_hints = parsed.get("subject_hints")
+        if subject_hints:
+            append(f"Subjects: {', '.join(subject_hints[:2])}")
+    
+    content = file_info.get("content")
+    if content:
+        summary = content.get("summary")
+        if summary:
+            # Capped at 80 characters, ellipsis included
+            append(summary if len(summary) <= 80 else f"{summary[:77]}...")
+        else:
+            keywords = content.get("keywords")
+            if keywords:
+                append(f"Keywords: {', '.join(keywords[:5])}")
+    
+    return " | ".join(note_parts)
 
 
 # AIWorker runs the AI interpretation in a background thread so the UI doesn't freeze.
@@ -66,8 +109,8 @@ class AIWorker(QThread):
                     # show the conversational reply in chat; tool results will appear as SYSTEM messages
                     "message": conversation or command.get("message", "") or "Processing your request..."
                 }
-                # Debug: log what we're emitting
-                print(f"[DEBUG] AIWorker emitting: action={ai['action']}, args={ai['args']}, message={ai['message'][:50]}")
+                # Debug: log what we're emitting (formatted only if DEBUG is enabled)
+                logger.debug("AIWorker emitting: action=%s, args=%s, message=%.50s", ai["action"], ai["args"], ai["message"])
                 self.finished.emit(ai)
                 return
 
@@ -76,7 +119,6 @@ class AIWorker(QThread):
 
         except Exception as e:
             import traceback
-            from config import get_ai_model
             current_model = get_ai_model()
             error_msg = f"Error: {str(e)}\n\nMake sure Ollama is running and the model '{current_model}' is installed."
             self.finished.emit({"action": "chat", "message": error_msg})
@@ -84,10 +126,10 @@ class AIWorker(QThread):
 
 # IndexingWorker scans all files in the root directory and generates notes
 # for them. Runs in the background on startup so the UI stays responsive.
-# Shows progress updates as it processes files.
+# Progress is published through progress_pct/progress_text, which the UI
+# polls on a timer instead of receiving a signal per file.
 class IndexingWorker(QThread):
     """Background worker for indexing files and generating notes"""
-    progress = pyqtSignal(int, int, str)  # current, total, filename
     finished = pyqtSignal()
     
     def __init__(self, perms, memory, skip_indexing=False):
@@ -96,17 +138,26 @@ class IndexingWorker(QThread):
         self.memory = memory
         self.skip_indexing = skip_indexing  # If True, skip indexing and only generate notes
         self._is_cancelled = False
+        # Latest progress (0-100) and status text, read by the UI's progress timer
+        self.progress_pct = 0
+        self.progress_text = ""
     
     def cancel(self):
         """Request cancellation"""
         self._is_cancelled = True
         self.requestInterruption()
     
+    def _set_progress(self, pct: int, text: str):
+        """Record progress for the UI to pick up on its next poll"""
+        self.progress_pct = pct
+        self.progress_text = text
+    
     def run(self):
         """Run indexing and note generation"""
+        # Memory is saved once at the end, whichever way the run exits
+        dirty = False
         try:
             if not self.perms.allowed_root or not self.perms.allowed_root.exists():
-                self.finished.emit()
                 return
             
             root_path = self.perms.allowed_root
@@ -119,10 +170,12 @@ class IndexingWorker(QThread):
                     "enabled_types": [],
                     "max_file_size": 5 * 1024 * 1024
                 }
+            # Unpacked once; can_read_content() rules out skipped types without calling the reader
+            content_enabled = bool(content_config.get("enabled", False))
+            enabled_types = frozenset(content_config.get("enabled_types", []))
             
             # Get AI model info for content analysis
-            from config import get_ai_model
-            ai_url = "http://localhost:11434/api/generate"
+            ai_url = OLLAMA_GENERATE_URL
             ai_model = get_ai_model()
             
             # Step 1: Index all files (skip if we already have valid index)
@@ -130,45 +183,88 @@ class IndexingWorker(QThread):
                 # Use existing index
                 file_index = self.memory.data.get("file_index", {})
                 all_files = file_index.get("all_files", [])
-                self.progress.emit(50, 100, "Using existing index...")
+                self._set_progress(50, "Using existing index...")
             else:
                 # Index all files
                 all_files = []
+                root_str = str(root_path)
                 
-                # First pass: collect all files
+                # Entries from the last scan of this root, by full path. A file whose
+                # mtime and size still match is reused as is, skipping parsing,
+                # content reading and analysis
+                prev_index = self.memory.data.get("file_index", {})
+                prev_by_path = {}
+                if prev_index.get("root_path") == root_str:
+                    prev_by_path = {f.get("full_path"): f for f in prev_index.get("all_files", [])}
+                
+                # First pass: collect all files as (full_path, relative_path, name, stat_key).
+                # Walks top-down in os.walk order; scandir entries carry their full
+                # path and type, so no Path objects per file. stat_key is
+                # (mtime_ns, size), or None if the file can't be stat'ed
                 file_paths = []
-                for root, dirs, files in os.walk(root_path):
+                root_prefix_len = len(root_str) if root_str.endswith(os.sep) else len(root_str) + 1
+                pending_dirs = [root_str]
+                while pending_dirs:
                     if self.isInterruptionRequested() or self._is_cancelled:
                         return
-                    dirs[:] = [d for d in dirs if not d.startswith('.')]
-                    files = [f for f in files if not f.startswith('.')]
-                    for file in files:
-                        file_path = Path(root) / file
-                        try:
-                            relative_path = file_path.relative_to(root_path)
-                            file_paths.append((file_path, relative_path))
-                        except (ValueError, PermissionError):
-                            continue
+                    subdirs = []
+                    try:
+                        with os.scandir(pending_dirs.pop()) as it:
+                            for entry in it:
+                                if entry.name.startswith('.'):
+                                    continue
+                                try:
+                                    is_dir = entry.is_dir()
+                                except OSError:
+                                    is_dir = False
+                                if not is_dir:
+                                    try:
+                                        st = entry.stat()
+                                        stat_key = (st.st_mtime_ns, st.st_size)
+                                    except OSError:
+                                        stat_key = None
+                                    file_paths.append((entry.path, entry.path[root_prefix_len:], entry.name, stat_key))
+                                elif not entry.is_symlink():
+                                    # Like os.walk, symlinked folders are not followed
+                                    subdirs.append(entry.path)
+                    except OSError:
+                        # Unreadable folders are skipped, as os.walk does
+                        continue
+                    # Reversed so the first subfolder is walked next
+                    pending_dirs.extend(reversed(subdirs))
                 
                 total_files = len(file_paths)
+                # Files with content, analyzed in batches once the pass is done
+                pending_analysis = []
                 
-                # Second pass: process files with progress updates
-                # Phase 1: Indexing (0-50% of progress)
-                for idx, (file_path, relative_path) in enumerate(file_paths):
-                    if self.isInterruptionRequested() or self._is_cancelled:
-                        return
+                def index_one(item):
+                    """Build one file's index entry; returns (file_info, content_data),
+                    or (None, None) if the file can't be indexed."""
+                    file_path, relative_path, name, stat_key = item
                     
-                    # Progress: 0-50% for indexing phase
-                    progress_pct = int((idx / total_files) * 50) if total_files > 0 else 0
-                    self.progress.emit(progress_pct, 100, f"Indexing: {file_path.name}")
+                    # Unchanged since the last scan: reuse its entry, unless content
+                    # reading is on now and the entry is missing content it could have
+                    prev = prev_by_path.get(file_path)
+                    if (prev is not None and stat_key is not None
+                            and (prev.get("_mtime"), prev.get("_size")) == stat_key
+                            and (not content_enabled or "content" in prev
+                                 or not can_read_content(prev.get("extension", ""), enabled_types))):
+                        return prev, None
                     
                     try:
+                        # Same rules as Path.suffix: no extension for a trailing dot
+                        dot = name.rfind('.')
+                        # Interned: thousands of entries share a handful of extensions
+                        extension = sys.intern(name[dot:].lower()) if 0 < dot < len(name) - 1 else ""
                         file_info = {
-                            "path": str(relative_path),
-                            "name": file_path.name,
-                            "full_path": str(file_path),
-                            "extension": file_path.suffix.lower()
+                            "path": relative_path,
+                            "name": name,
+                            "full_path": file_path,
+                            "extension": extension
                         }
+                        if stat_key is not None:
+                            # Compared on the next scan to tell whether the file changed
+                            file_info["_mtime"], file_info["_size"] = stat_key
                         
                         # Parse filename (ALWAYS do this - it's fast and provides basic info)
                         try:
@@ -179,57 +275,87 @@ class IndexingWorker(QThread):
                         
                         # Try to read content if enabled (but don't fail if it doesn't work)
                         content_data = None
-                        if content_config.get("enabled", False):
+                        if content_enabled and can_read_content(extension, enabled_types):
                             try:
                                 content_data = read_file_content(
-                                    file_path,
+                                    Path(file_path),
                                     file_info["extension"],
                                     content_config
                                 )
                             except Exception:
                                 # Content reading failed, but file is still indexed with filename info
                                 content_data = None
+                        return file_info, content_data
+                    except Exception:
+                        # Skip files we can't access - don't let one bad file stop indexing
+                        return None, None
+                
+                # Second pass: process files with progress updates
+                # Phase 1: Indexing (0-50% of progress, half of it for content analysis if enabled)
+                pass_span = 25 if content_enabled else 50
+                is_interrupted = self.isInterruptionRequested
+                # Content reads are disk I/O, so with content reading on several files
+                # are read at once; map() keeps results in scan order either way
+                executor = ThreadPoolExecutor(max_workers=INDEX_READ_WORKERS) if content_enabled else None
+                try:
+                    results = executor.map(index_one, file_paths) if executor else map(index_one, file_paths)
+                    for idx, (file_info, content_data) in enumerate(results):
+                        # cancel() sets _is_cancelled too, so the call into Qt is only
+                        # needed as a backstop every 64th file
+                        if self._is_cancelled or (idx & 63 == 0 and is_interrupted()):
+                            return
                         
-                        # Analyze content if we have it (skip if slow/optional)
+                        # The UI polls progress on a timer; every 32nd file is plenty
+                        if idx & 31 == 0:
+                            self._set_progress(int((idx / total_files) * pass_span), f"Indexing: {file_paths[idx][2]}")
+                        
+                        if file_info is None:
+                            continue
+                        # ALWAYS add file to index, even if content reading/analysis failed
+                        all_files.append(file_info)
+                        
+                        # Queue content analysis (file_info is updated in place when its batch runs)
                         if content_data:
+                            pending_analysis.append((file_info, content_data))
+                finally:
+                    if executor:
+                        # Drops reads still queued if the pass was cancelled
+                        executor.shutdown(wait=False, cancel_futures=True)
+                
+                # Analyze queued content: several files per Ollama request, several
+                # requests in flight at once
+                batches = [pending_analysis[i:i + ANALYSIS_BATCH_SIZE]
+                           for i in range(0, len(pending_analysis), ANALYSIS_BATCH_SIZE)]
+                if batches:
+                    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                        futures = [executor.submit(analyze_files_batch, batch, ai_url, ai_model) for batch in batches]
+                        for done, future in enumerate(as_completed(futures), 1):
+                            if self.isInterruptionRequested() or self._is_cancelled:
+                                # Drop queued batches; only the ones already running finish
+                                executor.shutdown(wait=False, cancel_futures=True)
+                                return
                             try:
-                                file_info = analyze_file(
-                                    file_info,
-                                    content_data,
-                                    ai_url,
-                                    ai_model
-                                )
+                                future.result()
                             except Exception:
-                                # Content analysis failed, but file is still indexed with filename info
+                                # Content analysis failed, but files are still indexed with filename info
                                 pass
-                        
-                        # ALWAYS add file to index, even if content reading/analysis failed
-                        all_files.append(file_info)
-                    except (ValueError, PermissionError):
-                        # Skip files we can't access, but continue with others
-                        continue
-                    except Exception:
-                        # Log error but continue - don't let one bad file stop indexing
-                        continue
+                            self._set_progress(25 + int((done / len(batches)) * 25), f"Analyzing content: {done}/{len(batches)}")
                 
                 # Store file index
                 if "file_index" not in self.memory.data:
                     self.memory.data["file_index"] = {}
-                self.memory.data["file_index"]["all_files"] = all_files
+                set_all_files(self.memory.data["file_index"], all_files)
                 self.memory.data["file_index"]["last_scan"] = time.time()
                 self.memory.data["file_index"]["root_path"] = str(root_path)
-                self.memory.save()
+                dirty = True
             
             # Step 2: Generate notes for root-level files
             if self.isInterruptionRequested() or self._is_cancelled:
                 return
             
-            root_files = [f for f in all_files if "/" not in f.get("path", "") or f.get("path", "").count("/") == 0]
-            existing_notes = self.memory.data.get("file_notes", {})
-            if "file_notes" not in self.memory.data:
-                self.memory.data["file_notes"] = {}
+            existing_notes = self.memory.data.setdefault("file_notes", {})
             
-            files_to_note = [f for f in root_files if str(f.get("path", "")) not in existing_notes]
+            files_to_note = root_files_without_notes(all_files, existing_notes)
             total_notes = len(files_to_note)
             
             # Phase 2: Note generation (50-100% of progress)
@@ -239,25 +365,29 @@ class IndexingWorker(QThread):
                 
                 # Progress: 50-100% for note generation phase
                 progress_pct = 50 + int((idx / total_notes) * 50) if total_notes > 0 else 50
-                self.progress.emit(progress_pct, 100, f"Generating note: {file_info.get('name', '')}")
+                self._set_progress(progress_pct, f"Generating note: {file_info.get('name', '')}")
                 
                 try:
                     file_path_str = str(file_info.get("path", ""))
-                    full_path = Path(root_path) / file_path_str
-                    if not full_path.exists():
+                    full_path = file_info.get("full_path") or os.path.join(root_path, file_path_str)
+                    # Files found by this run's scan are known to exist; only a
+                    # reused index (skip_indexing) can be stale
+                    if self.skip_indexing and not os.path.exists(full_path):
                         continue
                     
                     # Ensure parsed data exists
                     if "parsed" not in file_info:
                         file_info = parse_file_info(file_info)
+                        invalidate_keyword_index()
                     
                     # Read content if enabled and not already done
                     if "content" not in file_info:
                         content_data = None
-                        if content_config.get("enabled", False):
+                        extension = file_info.get("extension", "")
+                        if content_enabled and can_read_content(extension, enabled_types):
                             content_data = read_file_content(
-                                full_path,
-                                file_info.get("extension", ""),
+                                Path(full_path),
+                                extension,
                                 content_config
                             )
                         if content_data:
@@ -267,40 +397,137 @@ class IndexingWorker(QThread):
                                 ai_url,
                                 ai_model
                             )
+                            # New content keywords for an entry already in the index
+                            invalidate_keyword_index()
                     
                     # Generate note
-                    note_parts = []
-                    
-                    if file_info.get("parsed"):
-                        parsed = file_info["parsed"]
-                        if parsed.get("course"):
-                            note_parts.append(f"Course: {parsed['course']}")
-                        if parsed.get("type"):
-                            note_parts.append(f"Type: {parsed['type']}")
-                        if parsed.get("date"):
-                            note_parts.append(f"Date: {parsed['date']}")
-                        if parsed.get("subject_hints"):
-                            subjects = ", ".join(parsed["subject_hints"][:2])
-                            note_parts.append(f"Subjects: {subjects}")
-                    
-                    if file_info.get("content", {}).get("summary"):
-                        summary = file_info["content"]["summary"]
-                        if len(summary) > 80:
-                            summary = summary[:77] + "..."
-                        note_parts.append(summary)
-                    elif file_info.get("content", {}).get("keywords"):
-                        keywords = ", ".join(file_info["content"]["keywords"][:5])
-                        note_parts.append(f"Keywords: {keywords}")
-                    
-                    if note_parts:
-                        auto_note = " | ".join(note_parts)
+                    auto_note = _build_note(file_info)
+                    if auto_note:
                         self.memory.data["file_notes"][file_path_str] = auto_note
+                        dirty = True
                 except Exception:
                     continue
-            
-            # Save notes
-            self.memory.save()
-            self.finished.emit()
         except Exception:
-            self.finished.emit()
+            pass
+        finally:
+            # Single save and finished signal for every exit path, including
+            # cancellation (the UI stops its progress timer on finished)
+            try:
+                if dirty:
+                    self.memory.save()
+            finally:
+                self.finished.emit()
+
 
+
+# NoteGenerationWorker generates notes for the files picked by the
+# "Generate Notes" button. Content reading and AI analysis are network/IO
+# bound, so several files are processed at once on a small thread pool.
+# Notes are collected and handed back to the UI thread in one dict.
+# The pool works on copies of the index entries, since the UI thread may be
+# saving the real ones; entries that gained parsed/content data are handed
+# back alongside the notes for the UI thread to merge.
+class NoteGenerationWorker(QThread):
+    """Background worker for generating notes for a list of files"""
+    progress = pyqtSignal(int, str)  # files processed, filename
+    notes_chunk = pyqtSignal(dict, dict)  # {relative path: note}, {relative path: updated file_info}
+    # The same, for what wasn't sent in a chunk. Not named finished, so
+    # QThread.finished (the thread has actually exited) stays available
+    notes_done = pyqtSignal(dict, dict)
+    
+    def __init__(self, root_path, files, content_config, max_workers=MAX_CONCURRENT_REQUESTS, chunk_size=50):
+        super().__init__()
+        self.root_path = Path(root_path)
+        # Copied here, on the UI thread, so pool threads never touch the index
+        self.files = [dict(f) for f in files]
+        self.content_config = content_config
+        self.content_enabled = bool(content_config.get("enabled", False))
+        self.enabled_types = frozenset(content_config.get("enabled_types", []))
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._is_cancelled = False
+    
+    def cancel(self):
+        """Request cancellation"""
+        self._is_cancelled = True
+        self.requestInterruption()
+    
+    def run(self):
+        """Generate notes for all files, emitting progress as each one completes"""
+        notes = {}
+        updates = {}
+        try:
+            self.ai_url = OLLAMA_GENERATE_URL
+            self.ai_model = get_ai_model()
+            
+            emit_progress = self.progress.emit
+            total = len(self.files)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(self._process_one, self.files)
+                for done, (file_info, result) in enumerate(zip(self.files, results), 1):
+                    if self.isInterruptionRequested() or self._is_cancelled:
+                        # Drop queued files; only the ones already running finish
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    if result:
+                        file_path_str, note, updated_info = result
+                        notes[file_path_str] = note
+                        if updated_info is not None:
+                            updates[file_path_str] = updated_info
+                        # Hand off completed notes so they can be saved before the run ends
+                        if len(notes) >= self.chunk_size:
+                            self.notes_chunk.emit(notes, updates)
+                            notes = {}
+                            updates = {}
+                    # Every 16th file is plenty for the progress dialog
+                    if done & 15 == 0 or done == total:
+                        emit_progress(done, file_info.get("name", ""))
+        except Exception:
+            pass
+        self.notes_done.emit(notes, updates)
+    
+    def _process_one(self, file_info):
+        """
+        Parse, read and analyze one file.
+        
+        Returns (path, note, updated file_info or None if unchanged), or None
+        if no note was made.
+        """
+        try:
+            # parse_file_info/analyze_file add keys in place, so a change shows up
+            # as a longer dict
+            key_count = len(file_info)
+            file_path_str = str(file_info.get("path", ""))
+            full_path = self.root_path / file_path_str
+            if not full_path.exists():
+                return None
+            
+            # Ensure parsed data exists
+            if "parsed" not in file_info:
+                file_info = parse_file_info(file_info)
+            
+            # Read content if enabled and not already done
+            if "content" not in file_info:
+                content_data = None
+                extension = file_info.get("extension", "")
+                if self.content_enabled and can_read_content(extension, self.enabled_types):
+                    content_data = read_file_content(
+                        full_path,
+                        extension,
+                        self.content_config
+                    )
+                if content_data:
+                    file_info = analyze_file(
+                        file_info,
+                        content_data,
+                        self.ai_url,
+                        self.ai_model
+                    )
+            
+            # Generate note
+            note = _build_note(file_info)
+            if note:
+                return file_path_str, note, (file_info if len(file_info) != key_count else None)
+        except Exception:
+            pass
+        return None